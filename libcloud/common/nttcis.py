@@ -25,6 +25,42 @@ from base64 import b64encode
 from typing import Dict
 from functools import wraps
 
+
+def get_object_state(obj):
+    """
+    Return the lower cased state of an object returned by the API, which is
+    ``state`` for a compute ``Node`` and ``status`` for everything else.
+
+    :param obj: The object to get the state for
+    :type  obj: ``object``
+
+    :rtype: ``str``
+    """
+    if isinstance(obj, Node):
+        return obj.state.lower()
+    # BUG: need to use result.status.lower() or
+    #  will never match if client uses lower case
+    return obj.status.lower()
+
+
+def state_matches(object_state, state):
+    """
+    Check whether a state returned by :func:`get_object_state` is one of the
+    desired states
+
+    :param object_state: The lower cased state of an object
+    :type  object_state: ``str``
+
+    :param state: Either the desired state (`str`) or a `list` of states
+    :type  state: ``str`` or ``list``
+
+    :rtype: ``bool``
+    """
+    if isinstance(state, basestring):
+        return object_state in state.lower()
+    return object_state in [desired.lower() for desired in state]
+
+
 # TODO: use distutils.version when Travis CI fixed the pylint issue with version
 # from distutils.version import LooseVersion
 from libcloud.utils.py3 import b, httplib, basestring
@@ -536,16 +572,10 @@ class NttCisConnection(ConnectionUserAndKey):
         cnt = 0
         result = None
         object_state = None
-        state = state.lower()
         while cnt < timeout / poll_interval:
             result = func(*args, **kwargs)
-            if isinstance(result, Node):
-                object_state = result.state.lower()
-            else:
-                # BUG: need to use result.status.lower() or
-                #  will never match if client uses lower case
-                object_state = result.status.lower()
-            if object_state is state or object_state in state:
+            object_state = get_object_state(result)
+            if state_matches(object_state, state):
                 return result
             sleep(poll_interval)
             cnt += 1
@@ -1201,6 +1231,17 @@ class NttCisPool:
     NttCis VIP Pool.
     """
 
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "status",
+        "load_balance_method",
+        "health_monitor_id",
+        "service_down_action",
+        "slow_ramp_time",
+    )
+
     def __init__(
         self,
         id,
@@ -1262,6 +1303,8 @@ class NttCisPoolMember:
     NTTCIS VIP Pool Member.
     """
 
+    __slots__ = ("id", "name", "status", "ip", "port", "node_id")
+
     def __init__(self, id, name, status, ip, port, node_id):
         """
         Initialize an instance of ``NttCisPoolMember``
@@ -1303,6 +1346,16 @@ class NttCisPoolMember:
 
 
 class NttCisVIPNode:
+    __slots__ = (
+        "id",
+        "name",
+        "status",
+        "ip",
+        "connection_limit",
+        "connection_rate_limit",
+        "health_monitor_id",
+    )
+
     def __init__(
         self,
         id,
@@ -1357,6 +1410,8 @@ class NttCisVirtualListener:
     NTTCIS Virtual Listener.
     """
 
+    __slots__ = ("id", "name", "status", "ip")
+
     def __init__(self, id, name, status, ip):
         """
         Initialize an instance of :class:`NttCisVirtualListener`
@@ -1392,6 +1447,8 @@ class NttCisDefaultHealthMonitor:
     A default health monitor for a VIP (node, pool or listener)
     """
 
+    __slots__ = ("id", "name", "node_compatible", "pool_compatible")
+
     def __init__(self, id, name, node_compatible, pool_compatible):
         """
         Initialize an instance of :class:`NttCisDefaultHealthMonitor`
@@ -1425,6 +1482,8 @@ class NttCisPersistenceProfile:
     Fallback Persistence Profile.
     """
 
+    __slots__ = ("id", "name", "compatible_listeners", "fallback_compatible")
+
     def __init__(self, id, name, compatible_listeners, fallback_compatible):
         """
         Initialize an instance of :class:`NttCisPersistenceProfile`
@@ -1456,6 +1515,8 @@ class NttCisDefaultiRule:
     A default iRule for a network domain, can be applied to a listener
     """
 
+    __slots__ = ("id", "name", "compatible_listeners")
+
     def __init__(self, id, name, compatible_listeners):
         """
         Initialize an instance of :class:`NttCisefaultiRule`
@@ -1485,6 +1546,8 @@ class NttCisVirtualListenerCompatibility:
     applied to.
     """
 
+    __slots__ = ("type", "protocol")
+
     def __init__(self, type, protocol):
         self.type = type
         self.protocol = protocol
@@ -2321,13 +2384,17 @@ def process_xml(xml):
     will have the camel case found in the Java XML.  This a trade-off
     to reduce the number of "static" classes that all have to be synchronized
     with any changes in the API.
-    :param xml: The serialized version of the XML returned from Cloud Control
+    :param xml: The serialized version of the XML returned from Cloud Control,
+                or an already parsed element of any ElementTree
+                implementation
     :return:  a dynamic class that inherits from ClassFactory
     :rtype: `ClassFactory`
     """
     global attrs
-    tree = etree.parse(BytesIO(xml))
-    root = tree.getroot()
+    if isinstance(xml, (bytes, str)):
+        root = etree.parse(BytesIO(b(xml))).getroot()
+    else:
+        root = xml
     elem = root.tag.split("}")[1].capitalize()
     items = dict(root.items())
 
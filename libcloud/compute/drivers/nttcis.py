@@ -4817,7 +4817,7 @@ class NttCisNodeDriver(NodeDriver):
         return snapshots
 
     def _to_process(self, element):
-        return process_xml(ET.tostring(element))
+        return process_xml(element)
 
     def _format_csv(self, http_response):
         text = http_response.read()
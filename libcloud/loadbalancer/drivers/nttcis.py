@@ -13,9 +13,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from libcloud.utils.py3 import ET
-from libcloud.utils.xml import findall, findtext, fixxpath
-from libcloud.utils.misc import reverse_dict
+import os
+import copy
+import time
+import functools
+import threading
+from types import MappingProxyType
+from collections import namedtuple
+from xml.sax.saxutils import escape as xml_escape
+from concurrent.futures import ThreadPoolExecutor
+
+from libcloud.utils.py3 import ET, urlquote
+from libcloud.utils.xml import fixxpath
 from libcloud.common.nttcis import (
     TYPES_URN,
     API_ENDPOINTS,
@@ -24,6 +33,7 @@ from libcloud.common.nttcis import (
     NttCisVIPNode,
     NttCisConnection,
     NttCisPoolMember,
+    NttCisAPIException,
     NttCisDefaultiRule,
     NttCisVirtualListener,
     NttCisPersistenceProfile,
@@ -31,10 +41,206 @@ from libcloud.common.nttcis import (
     NttCisVirtualListenerCompatibility,
     get_params,
     process_xml,
+    state_matches,
+    get_object_state,
 )
 from libcloud.loadbalancer.base import DEFAULT_ALGORITHM, Driver, Member, Algorithm, LoadBalancer
 from libcloud.loadbalancer.types import State, Provider
 
+try:
+    from OpenSSL import crypto
+except ImportError:
+    crypto = None
+
+# Module level aliases of the ElementTree functions used to build requests
+_Element = ET.Element
+_SubElement = ET.SubElement
+_tostring = ET.tostring
+
+# Delay before the second state check in ex_wait_for_state, it doubles on
+# every following check up to the caller's poll_interval
+_WAIT_FOR_STATE_INITIAL_DELAY = 0.25
+
+NttCisLBSnapshot = namedtuple(
+    "NttCisLBSnapshot",
+    ["pools", "nodes", "ssl_domain_certs", "ssl_certificate_chains", "ssl_offload_profiles"],
+)
+
+# All protocols are supported, this is a list of the common ones
+_PROTOCOLS = ("http", "https", "tcp", "udp", "ftp", "smtp")
+
+# Response codes of a request which was accepted
+_OK_CODES = frozenset(("IN_PROGRESS", "OK"))
+
+# Namespace qualified tag names, so element lookups don't need to build
+# them on every call
+_RESPONSE_CODE_TAG = fixxpath("responseCode", TYPES_URN)
+_INFO_TAG = fixxpath("info", TYPES_URN)
+_DEFAULT_IRULE_TAG = fixxpath("defaultIrule", TYPES_URN)
+_IRULE_TAG = fixxpath("irule", TYPES_URN)
+_VIRTUAL_LISTENER_COMPATIBILITY_TAG = fixxpath("virtualListenerCompatibility", TYPES_URN)
+_DEFAULT_PERSISTENCE_PROFILE_TAG = fixxpath("defaultPersistenceProfile", TYPES_URN)
+_DEFAULT_HEALTH_MONITOR_TAG = fixxpath("defaultHealthMonitor", TYPES_URN)
+_HEALTH_MONITOR_TAG = fixxpath("healthMonitor", TYPES_URN)
+_NODE_TAG = fixxpath("node", TYPES_URN)
+_VIRTUAL_LISTENER_TAG = fixxpath("virtualListener", TYPES_URN)
+_POOL_TAG = fixxpath("pool", TYPES_URN)
+_POOL_MEMBER_TAG = fixxpath("poolMember", TYPES_URN)
+_SSL_DOMAIN_CERTIFICATE_TAG = fixxpath("sslDomainCertificate", TYPES_URN)
+_SSL_CERTIFICATE_CHAIN_TAG = fixxpath("sslCertificateChain", TYPES_URN)
+_SSL_OFFLOAD_PROFILE_TAG = fixxpath("sslOffloadProfile", TYPES_URN)
+_NAME_TAG = fixxpath("name", TYPES_URN)
+_STATE_TAG = fixxpath("state", TYPES_URN)
+_PORT_TAG = fixxpath("port", TYPES_URN)
+_IPV4_ADDRESS_TAG = fixxpath("ipv4Address", TYPES_URN)
+_IPV6_ADDRESS_TAG = fixxpath("ipv6Address", TYPES_URN)
+_LISTENER_IP_ADDRESS_TAG = fixxpath("listenerIpAddress", TYPES_URN)
+_NETWORK_DOMAIN_ID_TAG = fixxpath("networkDomainId", TYPES_URN)
+_CONNECTION_LIMIT_TAG = fixxpath("connectionLimit", TYPES_URN)
+_CONNECTION_RATE_LIMIT_TAG = fixxpath("connectionRateLimit", TYPES_URN)
+_NODE_COMPATIBLE_TAG = fixxpath("nodeCompatible", TYPES_URN)
+_POOL_COMPATIBLE_TAG = fixxpath("poolCompatible", TYPES_URN)
+
+# NttCisPool attribute and the tag of the text element it is read from
+_POOL_FIELDS = tuple(
+    (attr, fixxpath(tag, TYPES_URN))
+    for attr, tag in (
+        ("name", "name"),
+        ("status", "state"),
+        ("description", "description"),
+        ("load_balance_method", "loadBalanceMethod"),
+        ("health_monitor_id", "healthMonitorId"),
+        ("service_down_action", "serviceDownAction"),
+        ("slow_ramp_time", "slowRampTime"),
+    )
+)
+
+# Fixed-shape request bodies which are built as strings rather than through
+# a sequence of ET.SubElement calls. All the values are escaped with
+# _xml_text() / _xml_element() before being inserted.
+_CREATE_NODE_TEMPLATE = (
+    '<createNode xmlns="{xmlns}">'
+    "<networkDomainId>{network_domain_id}</networkDomainId>"
+    "<name>{name}</name>"
+    "{description}"
+    "<ipv4Address>{ip}</ipv4Address>"
+    "<status>ENABLED</status>"
+    "<connectionLimit>{connection_limit}</connectionLimit>"
+    "<connectionRateLimit>{connection_rate_limit}</connectionRateLimit>"
+    "</createNode>"
+)
+
+_CREATE_POOL_TEMPLATE = (
+    '<createPool xmlns="{xmlns}">'
+    "<networkDomainId>{network_domain_id}</networkDomainId>"
+    "<name>{name}</name>"
+    "<description>{description}</description>"
+    "<loadBalanceMethod>{load_balance_method}</loadBalanceMethod>"
+    "{health_monitors}"
+    "<serviceDownAction>{service_down_action}</serviceDownAction>"
+    "<slowRampTime>{slow_ramp_time}</slowRampTime>"
+    "</createPool>"
+)
+
+_ID_REQUEST_TEMPLATE = '<{tag} xmlns="{xmlns}" id="{id}" />'
+
+_SET_STATUS_TEMPLATE = '<{tag} xmlns="{xmlns}" id="{id}"><status>{status}</status></{tag}>'
+
+
+def _id_request(tag, id):
+    """
+    Return the body of a request which only identifies the object to act
+    on, e.g. ``<deletePool xmlns="..." id="..." />``, encoded as UTF-8.
+    """
+    return _ID_REQUEST_TEMPLATE.format(tag=tag, xmlns=TYPES_URN, id=_xml_attr(id)).encode("utf-8")
+
+
+def _set_status_request(tag, id, enabled):
+    """
+    Return the body of a request which enables or disables an object,
+    encoded as UTF-8.
+    """
+    return _SET_STATUS_TEMPLATE.format(
+        tag=tag, xmlns=TYPES_URN, id=_xml_attr(id), status=("DISABLED", "ENABLED")[bool(enabled)]
+    ).encode("utf-8")
+
+
+def _xml_attr(value):
+    """
+    Return ``value`` as a string which is safe to use inside a double quoted
+    attribute value.
+    """
+    return xml_escape(str(value), {'"': "&quot;"})
+
+
+def _xml_text(value):
+    """
+    Return ``value`` as a string which is safe to use as element text.
+    ``None`` is rendered as an empty string, the same as ElementTree does.
+    """
+    if value is None:
+        return ""
+    return xml_escape(str(value))
+
+
+def _xml_element(tag, value):
+    """
+    Return a serialized ``<tag>value</tag>`` element.
+    """
+    return "<{0}>{1}</{0}>".format(tag, _xml_text(value))
+
+
+def _add_child_elements(parent, fields):
+    """
+    Add a text child element to ``parent`` for every ``(tag, value)`` pair
+    in ``fields``. Pairs whose value is ``None`` are skipped.
+    """
+    SubElement = _SubElement
+    for tag, value in fields:
+        if value is not None:
+            SubElement(parent, tag).text = str(value)
+
+
+def _get_info_values(response):
+    """
+    Return the name / value pairs of the ``<info>`` elements in a response
+    as a dictionary.
+    """
+    return {info.get("name"): info.get("value") for info in response.iterfind(_INFO_TAG)}
+
+
+def _require_openssl():
+    """
+    Raise an ``ImportError`` if pyOpenSSL, which is needed to validate
+    certificates and keys, is not installed.
+    """
+    if crypto is None:
+        raise ImportError(
+            'Missing "OpenSSL" dependency. You can install it using pip - pip install pyopenssl'
+        )
+
+
+def _read_pem_file(path, load=None):
+    """
+    Return the contents of the PEM file at ``path``. When a pyOpenSSL
+    ``load`` function is given the contents are validated with it first.
+    Only the outcome of the validation is memoized, on the file's path,
+    modification time and size, the contents (which may be a private key)
+    are never cached.
+    """
+    if load is not None:
+        stat = os.stat(path)
+        _validate_pem_file(path, stat.st_mtime_ns, stat.st_size, load)
+
+    with open(path, encoding="utf-8") as fp:
+        return fp.read()
+
+
+@functools.lru_cache(maxsize=64)
+def _validate_pem_file(path, mtime_ns, size, load):
+    with open(path, encoding="utf-8") as fp:
+        load(crypto.FILETYPE_PEM, fp.read())
+
 
 class NttCisLBDriver(Driver):
     """
@@ -48,27 +254,37 @@ class NttCisLBDriver(Driver):
     type = Provider.NTTCIS
     api_version = 1.0
 
-    _VALUE_TO_ALGORITHM_MAP = {
-        "ROUND_ROBIN": Algorithm.ROUND_ROBIN,
-        "LEAST_CONNECTIONS_MEMBER": Algorithm.LEAST_CONNECTIONS_MEMBER,
-        "LEAST_CONNECTIONS_NODE": Algorithm.LEAST_CONNECTIONS_NODE,
-        "OBSERVED_MEMBER": Algorithm.OBSERVED_MEMBER,
-        "OBSERVED_NODE": Algorithm.OBSERVED_NODE,
-        "PREDICTIVE_MEMBER": Algorithm.PREDICTIVE_MEMBER,
-        "PREDICTIVE_NODE": Algorithm.PREDICTIVE_NODE,
-    }
-    _ALGORITHM_TO_VALUE_MAP = reverse_dict(_VALUE_TO_ALGORITHM_MAP)
-
-    _VALUE_TO_STATE_MAP = {
-        "NORMAL": State.RUNNING,
-        "PENDING_ADD": State.PENDING,
-        "PENDING_CHANGE": State.PENDING,
-        "PENDING_DELETE": State.PENDING,
-        "FAILED_ADD": State.ERROR,
-        "FAILED_CHANGE": State.ERROR,
-        "FAILED_DELETE": State.ERROR,
-        "REQUIRES_SUPPORT": State.ERROR,
-    }
+    _VALUE_TO_ALGORITHM_MAP = MappingProxyType(
+        {
+            "ROUND_ROBIN": Algorithm.ROUND_ROBIN,
+            "LEAST_CONNECTIONS_MEMBER": Algorithm.LEAST_CONNECTIONS_MEMBER,
+            "LEAST_CONNECTIONS_NODE": Algorithm.LEAST_CONNECTIONS_NODE,
+            "OBSERVED_MEMBER": Algorithm.OBSERVED_MEMBER,
+            "OBSERVED_NODE": Algorithm.OBSERVED_NODE,
+            "PREDICTIVE_MEMBER": Algorithm.PREDICTIVE_MEMBER,
+            "PREDICTIVE_NODE": Algorithm.PREDICTIVE_NODE,
+        }
+    )
+    _ALGORITHM_TO_VALUE_MAP = {v: k for k, v in _VALUE_TO_ALGORITHM_MAP.items()}
+
+    # Attributes of the root element of every request. ET.Element() copies
+    # the mapping, so these are never modified.
+    _NS = {"xmlns": TYPES_URN}
+    _NS_XSI = {"xmlns": TYPES_URN, "xmlns:xsi": "http://www.w3.org/2001/XMLSchema-instance"}
+
+    _VALUE_TO_STATE_MAP = MappingProxyType(
+        {
+            "NORMAL": State.RUNNING,
+            "PENDING_ADD": State.PENDING,
+            "PENDING_CHANGE": State.PENDING,
+            "PENDING_DELETE": State.PENDING,
+            "FAILED_ADD": State.ERROR,
+            "FAILED_CHANGE": State.ERROR,
+            "FAILED_DELETE": State.ERROR,
+            "REQUIRES_SUPPORT": State.ERROR,
+        }
+    )
+    _state_of = staticmethod(_VALUE_TO_STATE_MAP.get)
 
     def __init__(
         self,
@@ -80,9 +296,25 @@ class NttCisLBDriver(Driver):
         port=None,
         api_version=None,
         region=DEFAULT_REGION,
+        ex_cache_ttl=0,
         **kwargs,
     ):
+        """
+        :param ex_cache_ttl: Number of seconds for which the responses of
+                             read only requests are cached. This applies to
+                             list_balancers, get_balancer,
+                             balancer_list_members, ex_get_pool_members,
+                             ex_get_default_health_monitors,
+                             ex_get_default_persistence_profiles and
+                             ex_get_default_irules, which may then return
+                             stale results. Changes made through the driver
+                             don't invalidate the cache, use ex_clear_cache()
+                             for that. 0 (default) disables caching.
+        :type  ex_cache_ttl: ``int``
+        """
         self.network_domain_id = network_domain_id
+        self.ex_cache_ttl = ex_cache_ttl
+        self._response_cache = {}
 
         if region not in API_ENDPOINTS and host is None:
             raise ValueError("Invalid region: %s, no host specified" % (region))
@@ -109,6 +341,43 @@ class NttCisLBDriver(Driver):
         kwargs["region"] = self.selected_region
         return kwargs
 
+    def _cached_request(self, action, params=None):
+        """
+        Perform a GET request and return the parsed response.
+
+        When caching is enabled a response younger than ``ex_cache_ttl``
+        seconds is returned without a request. If the request fails with a
+        connection error, the last known response is returned instead.
+
+        Cache hits return the same element every time, callers must only
+        read it (e.g. convert it with one of the ``_to_*`` methods) and
+        never modify it.
+        """
+        if not self.ex_cache_ttl:
+            return self.connection.request_with_orgId_api_2(action, params=params).object
+
+        key = (action, tuple(sorted((params or {}).items())))
+        cached = self._response_cache.get(key)
+        now = time.time()
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        try:
+            result = self.connection.request_with_orgId_api_2(action, params=params).object
+        except OSError:
+            if cached is None:
+                raise
+            return cached[1]
+
+        self._response_cache[key] = (now + self.ex_cache_ttl, result)
+        return result
+
+    def ex_clear_cache(self):
+        """
+        Remove all the responses cached because of ``ex_cache_ttl``.
+        """
+        self._response_cache.clear()
+
     def create_balancer(
         self,
         name,
@@ -119,6 +388,7 @@ class NttCisLBDriver(Driver):
         members=None,
         optimization_profile="TCP",
         ex_listener_ip_address=None,
+        ex_parallel=False,
     ):
         """
 
@@ -156,6 +426,10 @@ class NttCisLBDriver(Driver):
                                        notation (x.x.x.x).
         :type ex_listener_ip_address: ``str``
 
+        :param ex_parallel: Create the nodes and pool members for ``members``
+                            concurrently instead of one after another.
+        :type ex_parallel: ``bool``
+
         :rtype: :class:`LoadBalancer`
         """
 
@@ -175,16 +449,32 @@ class NttCisLBDriver(Driver):
         )
 
         # Attach the members to the pool as nodes
-        if members is not None:
+        if members and ex_parallel:
+            # The connection objects are not safe to share between threads,
+            # so every worker gets a connection of its own. It is kept for
+            # all the members the worker adds, so the HTTPS session (and its
+            # keep-alive socket) is reused rather than set up per member.
+            # The orgId is resolved first so the copies share it.
+            self.connection._get_orgId()
+            local = threading.local()
+            workers = []
+
+            def add_pool_member(member):
+                driver = getattr(local, "driver", None)
+                if driver is None:
+                    driver = local.driver = self._copy_with_new_connection()
+                    workers.append(driver)
+                return driver._add_pool_member(network_domain_id, pool, member, port)
+
+            try:
+                with ThreadPoolExecutor(max_workers=min(8, len(members))) as executor:
+                    list(executor.map(add_pool_member, members))
+            finally:
+                for driver in workers:
+                    driver._close_connection()
+        elif members is not None:
             for member in members:
-                if not isinstance(member, Member):
-                    member = self.ex_create_node(
-                        network_domain_id=network_domain_id,
-                        name=member.name,
-                        ip=member.private_ips[0],
-                        ex_description=None,
-                    )
-                self.ex_create_pool_member(pool=pool, node=member, port=port)
+                self._add_pool_member(network_domain_id, pool, member, port)
 
         # Create the virtual listener (balancer)
         listener = self.ex_create_virtual_listener(
@@ -212,33 +502,58 @@ class NttCisLBDriver(Driver):
             },
         )
 
+    def _add_pool_member(self, network_domain_id, pool, member, port):
+        """
+        Add a member to a pool, creating a node for it first unless the
+        member is already a :class:`Member`.
+        """
+        if not isinstance(member, Member):
+            member = self.ex_create_node(
+                network_domain_id=network_domain_id,
+                name=member.name,
+                ip=member.private_ips[0],
+                ex_description=None,
+            )
+        return self.ex_create_pool_member(pool=pool, node=member, port=port)
+
+    def _copy_with_new_connection(self):
+        """
+        Return a shallow copy of the driver with a connection of its own, so
+        it can be used to perform requests from another thread. Callers
+        resolve the orgId before copying and close the copy's connection with
+        :meth:`_close_connection` once they are done with it.
+        """
+        driver = copy.copy(self)
+        driver.connection = copy.copy(self.connection)
+        driver.connection.connection = None
+        return driver
+
+    def _close_connection(self):
+        """
+        Close the HTTP session of the driver's connection, if one was opened.
+        """
+        if self.connection.connection is not None:
+            self.connection.connection.session.close()
+
     def ex_update_listener(self, virtual_listener, **kwargs):
         """
         Update a current virtual listener.
         :param virtual_listener: The listener to be updated
         :return: The edited version of the listener
         """
-        edit_listener_elm = ET.Element(
-            "editVirtualListener",
-            {
-                "xmlns": TYPES_URN,
-                "id": virtual_listener.id,
-                "xmlns:xsi": "http://www.w3.org/2001/" "XMLSchema-instance",
-            },
-        )
+        edit_listener_elm = _Element("editVirtualListener", self._NS_XSI, id=virtual_listener.id)
         for k, v in kwargs.items():
             if v is None:
-                ET.SubElement(edit_listener_elm, k, {"xsi:nil": "true"})
+                _SubElement(edit_listener_elm, k, {"xsi:nil": "true"})
             else:
-                ET.SubElement(edit_listener_elm, k).text = v
+                _SubElement(edit_listener_elm, k).text = v
 
         result = self.connection.request_with_orgId_api_2(
             "networkDomainVip/editVirtualListener",
             method="POST",
-            data=ET.tostring(edit_listener_elm),
+            data=_tostring(edit_listener_elm, encoding="utf-8"),
         ).object
-        response_code = findtext(result, "responseCode", TYPES_URN)
-        return response_code in ["IN_PROGRESS", "OK"]
+        return result.findtext(_RESPONSE_CODE_TAG) in _OK_CODES
 
     def list_balancers(self, ex_network_domain_id=None):
         """
@@ -258,9 +573,7 @@ class NttCisLBDriver(Driver):
             params = {"networkDomainId": ex_network_domain_id}
 
         return self._to_balancers(
-            self.connection.request_with_orgId_api_2(
-                "networkDomainVip/virtualListener", params=params
-            ).object
+            self._cached_request("networkDomainVip/virtualListener", params=params)
         )
 
     def get_balancer(self, balancer_id):
@@ -273,9 +586,9 @@ class NttCisLBDriver(Driver):
         :rtype: :class:`LoadBalancer`
         """
 
-        bal = self.connection.request_with_orgId_api_2(
-            "networkDomainVip/virtualListener/%s" % balancer_id
-        ).object
+        bal = self._cached_request(
+            "networkDomainVip/virtualListener/%s" % urlquote(balancer_id, safe="")
+        )
         return self._to_balancer(bal)
 
     def list_protocols(self):
@@ -287,7 +600,7 @@ class NttCisLBDriver(Driver):
 
         :rtype: ``list`` of ``str``
         """
-        return ["http", "https", "tcp", "udp", "ftp", "smtp"]
+        return list(_PROTOCOLS)
 
     def balancer_list_members(self, balancer):
         """
@@ -301,19 +614,16 @@ class NttCisLBDriver(Driver):
 
         :rtype: ``list`` of :class:`Member`
         """
-        pool_members = self.ex_get_pool_members(balancer.extra["pool_id"])
-        members = []
-        for pool_member in pool_members:
-            members.append(
-                Member(
-                    id=pool_member.id,
-                    ip=pool_member.ip,
-                    port=pool_member.port,
-                    balancer=balancer,
-                    extra=None,
-                )
+        return [
+            Member(
+                id=pool_member.id,
+                ip=pool_member.ip,
+                port=pool_member.port,
+                balancer=balancer,
+                extra=None,
             )
-        return members
+            for pool_member in self.ex_get_pool_members(balancer.extra["pool_id"])
+        ]
 
     def balancer_attach_member(self, balancer, member):
         """
@@ -354,15 +664,12 @@ class NttCisLBDriver(Driver):
         :return: ``True`` if member detach was successful, otherwise ``False``.
         :rtype: ``bool``
         """
-        create_pool_m = ET.Element("removePoolMember", {"xmlns": TYPES_URN, "id": member.id})
-
         result = self.connection.request_with_orgId_api_2(
             "networkDomainVip/removePoolMember",
             method="POST",
-            data=ET.tostring(create_pool_m),
+            data=_id_request("removePoolMember", member.id),
         ).object
-        response_code = findtext(result, "responseCode", TYPES_URN)
-        return response_code in ["IN_PROGRESS", "OK"]
+        return result.findtext(_RESPONSE_CODE_TAG) in _OK_CODES
 
     def destroy_balancer(self, balancer):
         """
@@ -374,17 +681,12 @@ class NttCisLBDriver(Driver):
         :return: ``True`` if the destroy was successful, otherwise ``False``.
         :rtype: ``bool``
         """
-        delete_listener = ET.Element(
-            "deleteVirtualListener", {"xmlns": TYPES_URN, "id": balancer.id}
-        )
-
         result = self.connection.request_with_orgId_api_2(
             "networkDomainVip/deleteVirtualListener",
             method="POST",
-            data=ET.tostring(delete_listener),
+            data=_id_request("deleteVirtualListener", balancer.id),
         ).object
-        response_code = findtext(result, "responseCode", TYPES_URN)
-        return response_code in ["IN_PROGRESS", "OK"]
+        return result.findtext(_RESPONSE_CODE_TAG) in _OK_CODES
 
     def ex_set_current_network_domain(self, network_domain_id):
         """
@@ -420,25 +722,25 @@ class NttCisLBDriver(Driver):
         :return: The node member, instance of ``NttCisPoolMember``
         :rtype: ``NttCisPoolMember``
         """
-        create_pool_m = ET.Element("addPoolMember", {"xmlns": TYPES_URN})
-        ET.SubElement(create_pool_m, "poolId").text = pool.id
-        ET.SubElement(create_pool_m, "nodeId").text = node.id
-        if port is not None:
-            ET.SubElement(create_pool_m, "port").text = str(port)
-        ET.SubElement(create_pool_m, "status").text = "ENABLED"
+        create_pool_m = _Element("addPoolMember", self._NS)
+        _add_child_elements(
+            create_pool_m,
+            (
+                ("poolId", pool.id),
+                ("nodeId", node.id),
+                ("port", port),
+                ("status", "ENABLED"),
+            ),
+        )
         response = self.connection.request_with_orgId_api_2(
             "networkDomainVip/addPoolMember",
             method="POST",
-            data=ET.tostring(create_pool_m),
+            data=_tostring(create_pool_m, encoding="utf-8"),
         ).object
 
-        member_id = None
-        node_name = None
-        for info in findall(response, "info", TYPES_URN):
-            if info.get("name") == "poolMemberId":
-                member_id = info.get("value")
-            if info.get("name") == "nodeName":
-                node_name = info.get("value")
+        info = _get_info_values(response)
+        member_id = info.get("poolMemberId")
+        node_name = info.get("nodeName")
 
         return NttCisPoolMember(
             id=member_id,
@@ -483,29 +785,28 @@ class NttCisLBDriver(Driver):
         :return: Instance of ``NttCisVIPNode``
         :rtype: ``NttCisVIPNode``
         """
-        create_node_elm = ET.Element("createNode", {"xmlns": TYPES_URN})
-        ET.SubElement(create_node_elm, "networkDomainId").text = network_domain_id
-        ET.SubElement(create_node_elm, "name").text = name
+        description = ""
         if ex_description is not None:
-            ET.SubElement(create_node_elm, "description").text = str(ex_description)
-        ET.SubElement(create_node_elm, "ipv4Address").text = ip
-        ET.SubElement(create_node_elm, "status").text = "ENABLED"
-        ET.SubElement(create_node_elm, "connectionLimit").text = str(connection_limit)
-        ET.SubElement(create_node_elm, "connectionRateLimit").text = str(connection_rate_limit)
+            description = _xml_element("description", ex_description)
+        create_node_data = _CREATE_NODE_TEMPLATE.format(
+            xmlns=TYPES_URN,
+            network_domain_id=_xml_text(network_domain_id),
+            name=_xml_text(name),
+            description=description,
+            ip=_xml_text(ip),
+            connection_limit=_xml_text(connection_limit),
+            connection_rate_limit=_xml_text(connection_rate_limit),
+        )
 
         response = self.connection.request_with_orgId_api_2(
             action="networkDomainVip/createNode",
             method="POST",
-            data=ET.tostring(create_node_elm),
+            data=create_node_data.encode("utf-8"),
         ).object
 
-        node_id = None
-        node_name = None
-        for info in findall(response, "info", TYPES_URN):
-            if info.get("name") == "nodeId":
-                node_id = info.get("value")
-            if info.get("name") == "name":
-                node_name = info.get("value")
+        info = _get_info_values(response)
+        node_id = info.get("nodeId")
+        node_name = info.get("name")
         return NttCisVIPNode(id=node_id, name=node_name, status=State.RUNNING, ip=ip)
 
     def ex_update_node(self, node):
@@ -518,16 +819,16 @@ class NttCisLBDriver(Driver):
         :return: The instance of ``NttCisNode``
         :rtype: ``NttCisNode``
         """
-        create_node_elm = ET.Element("editNode", {"xmlns": TYPES_URN})
+        create_node_elm = _Element("editNode", self._NS)
         create_node_elm.set("id", node.id)
-        ET.SubElement(create_node_elm, "healthMonitorId").text = node.health_monitor_id
-        ET.SubElement(create_node_elm, "connectionLimit").text = str(node.connection_limit)
-        ET.SubElement(create_node_elm, "connectionRateLimit").text = str(node.connection_rate_limit)
+        _SubElement(create_node_elm, "healthMonitorId").text = node.health_monitor_id
+        _SubElement(create_node_elm, "connectionLimit").text = str(node.connection_limit)
+        _SubElement(create_node_elm, "connectionRateLimit").text = str(node.connection_rate_limit)
 
         self.connection.request_with_orgId_api_2(
             action="networkDomainVip/editNode",
             method="POST",
-            data=ET.tostring(create_node_elm),
+            data=_tostring(create_node_elm, encoding="utf-8"),
         ).object
         return node
 
@@ -544,13 +845,10 @@ class NttCisLBDriver(Driver):
         :return: The instance of ``NttCisNode``
         :rtype: ``NttCisNode``
         """
-        create_node_elm = ET.Element("editNode", {"xmlns": TYPES_URN})
-        ET.SubElement(create_node_elm, "status").text = "ENABLED" if enabled is True else "DISABLED"
-
         self.connection.request_with_orgId_api_2(
             action="networkDomainVip/editNode",
             method="POST",
-            data=ET.tostring(create_node_elm),
+            data=_set_status_request("editNode", node.id, enabled),
         ).object
         return node
 
@@ -594,30 +892,30 @@ class NttCisLBDriver(Driver):
         :rtype: ``NttCisPool``
         """
         # Names cannot contain spaces.
-        name.replace(" ", "_")
-        create_node_elm = ET.Element("createPool", {"xmlns": TYPES_URN})
-        ET.SubElement(create_node_elm, "networkDomainId").text = network_domain_id
-        ET.SubElement(create_node_elm, "name").text = name
-        ET.SubElement(create_node_elm, "description").text = str(ex_description)
-        ET.SubElement(create_node_elm, "loadBalanceMethod").text = str(balancer_method)
-
+        name = name.replace(" ", "_")
+        monitors = ""
         if health_monitors is not None:
-            for monitor in health_monitors:
-                ET.SubElement(create_node_elm, "healthMonitorId").text = str(monitor.id)
-
-        ET.SubElement(create_node_elm, "serviceDownAction").text = service_down_action
-        ET.SubElement(create_node_elm, "slowRampTime").text = str(slow_ramp_time)
+            monitors = "".join(
+                _xml_element("healthMonitorId", monitor.id) for monitor in health_monitors
+            )
+        create_pool_data = _CREATE_POOL_TEMPLATE.format(
+            xmlns=TYPES_URN,
+            network_domain_id=_xml_text(network_domain_id),
+            name=_xml_text(name),
+            description=_xml_text(str(ex_description)),
+            load_balance_method=_xml_text(str(balancer_method)),
+            health_monitors=monitors,
+            service_down_action=_xml_text(service_down_action),
+            slow_ramp_time=_xml_text(str(slow_ramp_time)),
+        )
 
         response = self.connection.request_with_orgId_api_2(
             action="networkDomainVip/createPool",
             method="POST",
-            data=ET.tostring(create_node_elm),
+            data=create_pool_data.encode("utf-8"),
         ).object
 
-        pool_id = None
-        for info in findall(response, "info", TYPES_URN):
-            if info.get("name") == "poolId":
-                pool_id = info.get("value")
+        pool_id = _get_info_values(response).get("poolId")
 
         return NttCisPool(
             id=pool_id,
@@ -704,10 +1002,7 @@ class NttCisLBDriver(Driver):
         :return: Instance of the listener
         :rtype: ``NttCisVirtualListener``
         """
-        if (port == 80) or (port == 443):
-            listener_type = "PERFORMANCE_LAYER_4"
-        else:
-            listener_type = "STANDARD"
+        listener_type = "PERFORMANCE_LAYER_4" if port in (80, 443) else "STANDARD"
 
         if listener_type == "STANDARD" and optimization_profile is None:
             raise ValueError(
@@ -715,46 +1010,45 @@ class NttCisLBDriver(Driver):
                 " required for type STANDARD and protocol TCP"
             )
 
-        create_node_elm = ET.Element("createVirtualListener", {"xmlns": TYPES_URN})
-        ET.SubElement(create_node_elm, "networkDomainId").text = network_domain_id
-        ET.SubElement(create_node_elm, "name").text = name
-        ET.SubElement(create_node_elm, "description").text = str(ex_description)
-        ET.SubElement(create_node_elm, "type").text = listener_type
-        ET.SubElement(create_node_elm, "protocol").text = protocol
+        parts = [
+            '<createVirtualListener xmlns="%s">' % (TYPES_URN),
+            _xml_element("networkDomainId", network_domain_id),
+            _xml_element("name", name),
+            _xml_element("description", str(ex_description)),
+            _xml_element("type", listener_type),
+            _xml_element("protocol", protocol),
+        ]
         if listener_ip_address is not None:
-            ET.SubElement(create_node_elm, "listenerIpAddress").text = str(listener_ip_address)
+            parts.append(_xml_element("listenerIpAddress", listener_ip_address))
         if port is not None:
-            ET.SubElement(create_node_elm, "port").text = str(port)
-        ET.SubElement(create_node_elm, "enabled").text = "true"
-        ET.SubElement(create_node_elm, "connectionLimit").text = str(connection_limit)
-        ET.SubElement(create_node_elm, "connectionRateLimit").text = str(connection_rate_limit)
-        ET.SubElement(create_node_elm, "sourcePortPreservation").text = source_port_preservation
+            parts.append(_xml_element("port", port))
+        parts.append(_xml_element("enabled", "true"))
+        parts.append(_xml_element("connectionLimit", connection_limit))
+        parts.append(_xml_element("connectionRateLimit", connection_rate_limit))
+        parts.append(_xml_element("sourcePortPreservation", source_port_preservation))
         if pool is not None:
-            ET.SubElement(create_node_elm, "poolId").text = pool.id
+            parts.append(_xml_element("poolId", pool.id))
         if persistence_profile is not None:
-            ET.SubElement(create_node_elm, "persistenceProfileId").text = persistence_profile.id
+            parts.append(_xml_element("persistenceProfileId", persistence_profile.id))
         if optimization_profile is not None:
-            ET.SubElement(create_node_elm, "optimizationProfile").text = optimization_profile
+            parts.append(_xml_element("optimizationProfile", optimization_profile))
         if fallback_persistence_profile is not None:
-            ET.SubElement(create_node_elm, "fallbackPersistenceProfileId").text = (
-                fallback_persistence_profile.id
+            parts.append(
+                _xml_element("fallbackPersistenceProfileId", fallback_persistence_profile.id)
             )
         if irule is not None:
-            ET.SubElement(create_node_elm, "iruleId").text = irule.id
+            parts.append(_xml_element("iruleId", irule.id))
+        parts.append("</createVirtualListener>")
 
         response = self.connection.request_with_orgId_api_2(
             action="networkDomainVip/createVirtualListener",
             method="POST",
-            data=ET.tostring(create_node_elm),
+            data="".join(parts).encode("utf-8"),
         ).object
 
-        virtual_listener_id = None
-        virtual_listener_ip = None
-        for info in findall(response, "info", TYPES_URN):
-            if info.get("name") == "virtualListenerId":
-                virtual_listener_id = info.get("value")
-            if info.get("name") == "listenerIpAddress":
-                virtual_listener_ip = info.get("value")
+        info = _get_info_values(response)
+        virtual_listener_id = info.get("virtualListenerId")
+        virtual_listener_ip = info.get("listenerIpAddress")
 
         return NttCisVirtualListener(
             id=virtual_listener_id,
@@ -764,7 +1058,7 @@ class NttCisLBDriver(Driver):
         )
 
     def ex_import_ssl_domain_certificate(
-        self, network_domain_id, name, crt_file, key_file, description=None
+        self, network_domain_id, name, crt_file, key_file, description=None, validate=False
     ):
         """
         Import an ssl cert for ssl offloading onto the the load balancer
@@ -773,49 +1067,42 @@ class NttCisLBDriver(Driver):
         :type network_domain_id: ``str``
         :param name: The name of the ssl certificate
         :type name: ``str``
-        :param crt_file: The complete path to the certificate file
+        :param crt_file: The complete path to the certificate file (PEM)
         :type crt_file: ``str``
-        :param key_file: The complete pathy to the key file
+        :param key_file: The complete pathy to the key file (PEM)
         :type key_file: ``str``
         :param description: (Optional) A description of the certificate
         :type `description: `str``
+        :param validate: (Optional) Parse the certificate and the key with
+                         pyOpenSSL before sending them. Requires pyopenssl.
+        :type validate: ``bool``
         :return: ``bool``
         """
-        try:
-            import OpenSSL
-        except ImportError:
-            raise ImportError(
-                'Missing "OpenSSL" dependency. You can install '
-                "it using pip - pip install pyopenssl"
-            )
-
-        with open(crt_file) as fp:
-            c = OpenSSL.crypto.load_certificate(OpenSSL.crypto.FILETYPE_PEM, fp.read())
-
-        cert = OpenSSL.crypto.dump_certificate(OpenSSL.crypto.FILETYPE_PEM, c).decode(
-            encoding="utf-8"
-        )
-
-        with open(key_file) as fp:
-            k = OpenSSL.crypto.load_privatekey(OpenSSL.crypto.FILETYPE_PEM, fp.read())
-
-        key = OpenSSL.crypto.dump_privatekey(OpenSSL.crypto.FILETYPE_PEM, k).decode(
-            encoding="utf-8"
+        if validate:
+            _require_openssl()
+            cert = _read_pem_file(crt_file, crypto.load_certificate)
+            key = _read_pem_file(key_file, crypto.load_privatekey)
+        else:
+            cert = _read_pem_file(crt_file)
+            key = _read_pem_file(key_file)
+
+        cert_elem = _Element("importSslDomainCertificate", self._NS)
+        _add_child_elements(
+            cert_elem,
+            (
+                ("networkDomainId", network_domain_id),
+                ("name", name),
+                ("description", description),
+                ("key", key),
+                ("certificate", cert),
+            ),
         )
-        cert_elem = ET.Element("importSslDomainCertificate", {"xmlns": TYPES_URN})
-        ET.SubElement(cert_elem, "networkDomainId").text = network_domain_id
-        ET.SubElement(cert_elem, "name").text = name
-        if description is not None:
-            ET.SubElement(cert_elem, "description").text = description
-        ET.SubElement(cert_elem, "key").text = key
-        ET.SubElement(cert_elem, "certificate").text = cert
         result = self.connection.request_with_orgId_api_2(
             "networkDomainVip/importSslDomainCertificate",
             method="POST",
-            data=ET.tostring(cert_elem),
+            data=_tostring(cert_elem, encoding="utf-8"),
         ).object
-        response_code = findtext(result, "responseCode", TYPES_URN)
-        return response_code in ["IN_PROGRESS", "OK"]
+        return result.findtext(_RESPONSE_CODE_TAG) in _OK_CODES
 
     def ex_delete_ssl_domain_certificate(self, dom_cert_id):
         """
@@ -825,18 +1112,16 @@ class NttCisLBDriver(Driver):
         :type dom_cert_id: ``str``
         :return: ``bool``
         """
-        del_dom_cert_elem = ET.Element(
-            "deleteSslDomainCertificate", {"id": dom_cert_id, "xmlns": TYPES_URN}
-        )
         result = self.connection.request_with_orgId_api_2(
             "networkDomainVip/deleteSslDomainCertificate",
             method="POST",
-            data=ET.tostring(del_dom_cert_elem),
+            data=_id_request("deleteSslDomainCertificate", dom_cert_id),
         ).object
-        response_code = findtext(result, "responseCode", TYPES_URN)
-        return response_code in ["IN_PROGRESS", "OK"]
+        return result.findtext(_RESPONSE_CODE_TAG) in _OK_CODES
 
-    def ex_import_ssl_cert_chain(self, network_domain_id, name, chain_crt_file, description=None):
+    def ex_import_ssl_cert_chain(
+        self, network_domain_id, name, chain_crt_file, description=None, validate=False
+    ):
         """
         Import an ssl certificate chain for ssl offloading onto
         the the load balancer
@@ -849,32 +1134,33 @@ class NttCisLBDriver(Driver):
         :type chain_crt_file: ``str``
         :param description: (Optional) A description of the certificate chain
         :type description: ``str``
+        :param validate: (Optional) Parse the certificate chain with pyOpenSSL
+                         before sending it. Requires pyopenssl.
+        :type validate: ``bool``
         :return: ``bool``
         """
-        try:
-            import OpenSSL
-            from OpenSSL import crypto
-        except ImportError:
-            raise ImportError(
-                'Missing "OpenSSL" dependency. You can install '
-                "it using pip - pip install pyopenssl"
-            )
-
-        c = crypto.load_certificate(crypto.FILETYPE_PEM, open(chain_crt_file).read())
-        cert = OpenSSL.crypto.dump_certificate(crypto.FILETYPE_PEM, c).decode(encoding="utf-8")
-        cert_chain_elem = ET.Element("importSslCertificateChain", {"xmlns": TYPES_URN})
-        ET.SubElement(cert_chain_elem, "networkDomainId").text = network_domain_id
-        ET.SubElement(cert_chain_elem, "name").text = name
-        if description is not None:
-            ET.SubElement(cert_chain_elem, "description").text = description
-        ET.SubElement(cert_chain_elem, "certificateChain").text = cert
+        if validate:
+            _require_openssl()
+            cert = _read_pem_file(chain_crt_file, crypto.load_certificate)
+        else:
+            cert = _read_pem_file(chain_crt_file)
+
+        cert_chain_elem = _Element("importSslCertificateChain", self._NS)
+        _add_child_elements(
+            cert_chain_elem,
+            (
+                ("networkDomainId", network_domain_id),
+                ("name", name),
+                ("description", description),
+                ("certificateChain", cert),
+            ),
+        )
         result = self.connection.request_with_orgId_api_2(
             "networkDomainVip/importSslCertificateChain",
             method="POST",
-            data=ET.tostring(cert_chain_elem),
+            data=_tostring(cert_chain_elem, encoding="utf-8"),
         ).object
-        response_code = findtext(result, "responseCode", TYPES_URN)
-        return response_code in ["IN_PROGRESS", "OK"]
+        return result.findtext(_RESPONSE_CODE_TAG) in _OK_CODES
 
     def ex_delete_ssl_certificate_chain(self, cert_chain_id):
         """
@@ -884,16 +1170,12 @@ class NttCisLBDriver(Driver):
         :type cert_chain_id: ``str``
         :return ``bool``
         """
-        del_cert_chain_elem = ET.Element(
-            "deleteSslCertificateChain", {"id": cert_chain_id, "xmlns": TYPES_URN}
-        )
         result = self.connection.request_with_orgId_api_2(
             "networkDomainVip/deleteSslCertificateChain",
             method="POST",
-            data=ET.tostring(del_cert_chain_elem),
+            data=_id_request("deleteSslCertificateChain", cert_chain_id),
         ).object
-        response_code = findtext(result, "responseCode", TYPES_URN)
-        return response_code in ["IN_PROGRESS", "OK"]
+        return result.findtext(_RESPONSE_CODE_TAG) in _OK_CODES
 
     def ex_create_ssl_offload_profile(
         self,
@@ -926,23 +1208,17 @@ class NttCisLBDriver(Driver):
         :type ssl_cert_chain_id: `str``
         :returns: ``bool``
         """
-        ssl_offload_elem = ET.Element("createSslOffloadProfile", {"xmlns": TYPES_URN})
-        ET.SubElement(ssl_offload_elem, "networkDomainId").text = netowrk_domain_id
-        ET.SubElement(ssl_offload_elem, "name").text = name
-        if description is not None:
-            ET.SubElement(ssl_offload_elem, "description").text = description
-        if ciphers is not None:
-            ET.SubElement(ssl_offload_elem, "ciphers").text = ciphers
-        ET.SubElement(ssl_offload_elem, "sslDomainCertificateId").text = ssl_domain_cert_id
-        if ssl_cert_chain_id is not None:
-            ET.SubElement(ssl_offload_elem, "sslCertificateChainId").text = ssl_cert_chain_id
-        result = self.connection.request_with_orgId_api_2(
-            "networkDomainVip/createSslOffloadProfile",
-            method="POST",
-            data=ET.tostring(ssl_offload_elem),
-        ).object
-        response_code = findtext(result, "responseCode", TYPES_URN)
-        return response_code in ["IN_PROGRESS", "OK"]
+        return self._ssl_offload_profile_request(
+            "createSslOffloadProfile",
+            (
+                ("networkDomainId", netowrk_domain_id),
+                ("name", name),
+                ("description", description),
+                ("ciphers", ciphers),
+                ("sslDomainCertificateId", ssl_domain_cert_id),
+                ("sslCertificateChainId", ssl_cert_chain_id),
+            ),
+        )
 
     def ex_edit_ssl_offload_profile(
         self,
@@ -971,24 +1247,39 @@ class NttCisLBDriver(Driver):
         :type: ssl_cert_chain_id: ``str``
         :returns: ``bool``
         """
-        ssl_offload_elem = ET.Element(
-            "editSslOffloadProfile", {"xmlns": TYPES_URN, "id": profile_id}
+        return self._ssl_offload_profile_request(
+            "editSslOffloadProfile",
+            (
+                ("name", name),
+                ("description", description),
+                ("ciphers", ciphers),
+                ("sslDomainCertificateId", ssl_domain_cert_id),
+                ("sslCertificateChainId", ssl_cert_chain_id),
+            ),
+            id=profile_id,
         )
-        ET.SubElement(ssl_offload_elem, "name").text = name
-        if description is not None:
-            ET.SubElement(ssl_offload_elem, "description").text = description
-        if ciphers is not None:
-            ET.SubElement(ssl_offload_elem, "ciphers").text = ciphers
-        ET.SubElement(ssl_offload_elem, "sslDomainCertificateId").text = ssl_domain_cert_id
-        if ssl_cert_chain_id is not None:
-            ET.SubElement(ssl_offload_elem, "sslCertificateChainId").text = ssl_cert_chain_id
+
+    def _ssl_offload_profile_request(self, operation, fields, **attrs):
+        """
+        Send a create or edit SSL offload profile request.
+
+        :param operation: ``createSslOffloadProfile`` or
+                          ``editSslOffloadProfile``
+        :type operation: ``str``
+        :param fields: ``(tag, value)`` pairs of the profile's fields, pairs
+                       whose value is ``None`` are left out
+        :type fields: ``tuple``
+        :param attrs: Attributes of the request element, i.e. the profile id
+        :returns: ``bool``
+        """
+        ssl_offload_elem = _Element(operation, self._NS, **attrs)
+        _add_child_elements(ssl_offload_elem, fields)
         result = self.connection.request_with_orgId_api_2(
-            "networkDomainVip/editSslOffloadProfile",
+            "networkDomainVip/%s" % operation,
             method="POST",
-            data=ET.tostring(ssl_offload_elem),
+            data=_tostring(ssl_offload_elem, encoding="utf-8"),
         ).object
-        response_code = findtext(result, "responseCode", TYPES_URN)
-        return response_code in ["IN_PROGRESS", "OK"]
+        return result.findtext(_RESPONSE_CODE_TAG) in _OK_CODES
 
     def ex_delete_ssl_offload_profile(self, profile_id):
         """
@@ -998,16 +1289,12 @@ class NttCisLBDriver(Driver):
         :type profile_id: ``str``
         :returns: ``bool``
         """
-        del_profile_elem = ET.Element(
-            "deleteSslOffloadProfile", {"id": profile_id, "xmlns": TYPES_URN}
-        )
         result = self.connection.request_with_orgId_api_2(
             "networkDomainVip/deleteSslOffloadProfile",
             method="POST",
-            data=ET.tostring(del_profile_elem),
+            data=_id_request("deleteSslOffloadProfile", profile_id),
         ).object
-        response_code = findtext(result, "responseCode", TYPES_URN)
-        return response_code in ["IN_PROGRESS", "OK"]
+        return result.findtext(_RESPONSE_CODE_TAG) in _OK_CODES
 
     def ex_get_pools(self, ex_network_domain_id=None):
         """
@@ -1043,7 +1330,9 @@ class NttCisLBDriver(Driver):
         :return: Returns an instance of ``NttCisPool``
         :rtype: ``NttCisPool``
         """
-        pool = self.connection.request_with_orgId_api_2("networkDomainVip/pool/%s" % pool_id).object
+        pool = self.connection.request_with_orgId_api_2(
+            "networkDomainVip/pool/%s" % urlquote(pool_id, safe="")
+        ).object
         return self._to_pool(pool)
 
     def ex_update_pool(self, pool):
@@ -1057,20 +1346,19 @@ class NttCisLBDriver(Driver):
         :return: ``True`` for success, ``False`` for failure
         :rtype: ``bool``
         """
-        create_node_elm = ET.Element("editPool", {"xmlns": TYPES_URN})
+        create_node_elm = _Element("editPool", self._NS)
         create_node_elm.set("id", pool.id)
-        ET.SubElement(create_node_elm, "loadBalanceMethod").text = str(pool.load_balance_method)
-        ET.SubElement(create_node_elm, "healthMonitorId").text = pool.health_monitor_id
-        ET.SubElement(create_node_elm, "serviceDownAction").text = pool.service_down_action
-        ET.SubElement(create_node_elm, "slowRampTime").text = str(pool.slow_ramp_time)
+        _SubElement(create_node_elm, "loadBalanceMethod").text = str(pool.load_balance_method)
+        _SubElement(create_node_elm, "healthMonitorId").text = pool.health_monitor_id
+        _SubElement(create_node_elm, "serviceDownAction").text = pool.service_down_action
+        _SubElement(create_node_elm, "slowRampTime").text = str(pool.slow_ramp_time)
 
         response = self.connection.request_with_orgId_api_2(
             action="networkDomainVip/editPool",
             method="POST",
-            data=ET.tostring(create_node_elm),
+            data=_tostring(create_node_elm, encoding="utf-8"),
         ).object
-        response_code = findtext(response, "responseCode", TYPES_URN)
-        return response_code in ["IN_PROGRESS", "OK"]
+        return response.findtext(_RESPONSE_CODE_TAG) in _OK_CODES
 
     def ex_destroy_pool(self, pool):
         """
@@ -1082,15 +1370,12 @@ class NttCisLBDriver(Driver):
         :return: ``True`` for success, ``False`` for failure
         :rtype: ``bool``
         """
-        destroy_request = ET.Element("deletePool", {"xmlns": TYPES_URN, "id": pool.id})
-
         result = self.connection.request_with_orgId_api_2(
             action="networkDomainVip/deletePool",
             method="POST",
-            data=ET.tostring(destroy_request),
+            data=_id_request("deletePool", pool.id),
         ).object
-        response_code = findtext(result, "responseCode", TYPES_URN)
-        return response_code in ["IN_PROGRESS", "OK"]
+        return result.findtext(_RESPONSE_CODE_TAG) in _OK_CODES
 
     def ex_get_pool_members(self, pool_id):
         """
@@ -1102,9 +1387,9 @@ class NttCisLBDriver(Driver):
         :returns: Returns an ``list`` of ``NttCisPoolMember``
         :rtype: ``list`` of ``NttCisPoolMember``
         """
-        members = self.connection.request_with_orgId_api_2(
-            "networkDomainVip/poolMember?poolId=%s" % pool_id
-        ).object
+        members = self._cached_request(
+            "networkDomainVip/poolMember?poolId=%s" % urlquote(pool_id, safe="")
+        )
         return self._to_members(members)
 
     def ex_get_pool_member(self, pool_member_id):
@@ -1118,23 +1403,18 @@ class NttCisLBDriver(Driver):
         :rtype: ``NttCisPoolMember``
         """
         member = self.connection.request_with_orgId_api_2(
-            "networkDomainVip/poolMember/%s" % pool_member_id
+            "networkDomainVip/poolMember/%s" % urlquote(pool_member_id, safe="")
         ).object
         return self._to_member(member)
 
     def ex_set_pool_member_state(self, member, enabled=True):
-        request = ET.Element("editPoolMember", {"xmlns": TYPES_URN, "id": member.id})
-        state = "ENABLED" if enabled is True else "DISABLED"
-        ET.SubElement(request, "status").text = state
-
         result = self.connection.request_with_orgId_api_2(
             action="networkDomainVip/editPoolMember",
             method="POST",
-            data=ET.tostring(request),
+            data=_set_status_request("editPoolMember", member.id, enabled),
         ).object
 
-        response_code = findtext(result, "responseCode", TYPES_URN)
-        return response_code in ["IN_PROGRESS", "OK"]
+        return result.findtext(_RESPONSE_CODE_TAG) in _OK_CODES
 
     def ex_destroy_pool_member(self, member, destroy_node=False):
         """
@@ -1150,19 +1430,16 @@ class NttCisLBDriver(Driver):
         :rtype: ``bool``
         """
         # remove the pool member
-        destroy_request = ET.Element("removePoolMember", {"xmlns": TYPES_URN, "id": member.id})
-
         result = self.connection.request_with_orgId_api_2(
             action="networkDomainVip/removePoolMember",
             method="POST",
-            data=ET.tostring(destroy_request),
+            data=_id_request("removePoolMember", member.id),
         ).object
 
         if member.node_id is not None and destroy_node is True:
             return self.ex_destroy_node(member.node_id)
         else:
-            response_code = findtext(result, "responseCode", TYPES_URN)
-            return response_code in ["IN_PROGRESS", "OK"]
+            return result.findtext(_RESPONSE_CODE_TAG) in _OK_CODES
 
     def ex_get_nodes(self, ex_network_domain_id=None):
         """
@@ -1193,7 +1470,7 @@ class NttCisLBDriver(Driver):
         :rtype: Instance of ``NttCisVIPNode``
         """
         nodes = self.connection.request_with_orgId_api_2(
-            "networkDomainVip/node/%s" % node_id
+            "networkDomainVip/node/%s" % urlquote(node_id, safe="")
         ).object
         return self._to_node(nodes)
 
@@ -1208,22 +1485,21 @@ class NttCisLBDriver(Driver):
         :rtype: ``bool``
         """
         # Destroy the node
-        destroy_request = ET.Element("deleteNode", {"xmlns": TYPES_URN, "id": node_id})
-
         result = self.connection.request_with_orgId_api_2(
             action="networkDomainVip/deleteNode",
             method="POST",
-            data=ET.tostring(destroy_request),
+            data=_id_request("deleteNode", node_id),
         ).object
-        response_code = findtext(result, "responseCode", TYPES_URN)
-        return response_code in ["IN_PROGRESS", "OK"]
+        return result.findtext(_RESPONSE_CODE_TAG) in _OK_CODES
 
     def ex_wait_for_state(self, state, func, poll_interval=2, timeout=60, *args, **kwargs):
         """
-        Wait for the function which returns a instance
-        with field status to match
+        Wait for the function which returns a instance with field
+        status/state to match
 
-        Keep polling func until one of the desired states is matched
+        Keep polling func until one of the desired states is matched. The
+        first checks are made in quick succession, the delay between checks
+        then doubles until it reaches ``poll_interval``.
 
         :param state: Either the desired state (`str`) or a `list` of states
         :type  state: ``str`` or ``list``
@@ -1231,7 +1507,8 @@ class NttCisLBDriver(Driver):
         :param  func: The function to call, e.g. ex_get_vlan
         :type   func: ``function``
 
-        :param  poll_interval: The number of seconds to wait between checks
+        :param  poll_interval: The maximum number of seconds to wait between
+                               checks
         :type   poll_interval: `int`
 
         :param  timeout: The total number of seconds to wait to reach a state
@@ -1243,7 +1520,25 @@ class NttCisLBDriver(Driver):
         :param  kwargs: The arguments for func
         :type   kwargs: Keyword arguments
         """
-        return self.connection.wait_for_state(state, func, poll_interval, timeout, *args, **kwargs)
+        if poll_interval <= 0:
+            raise ValueError("poll_interval must be positive, got %s" % (poll_interval))
+
+        deadline = time.monotonic() + timeout
+        delay = min(_WAIT_FOR_STATE_INITIAL_DELAY, poll_interval)
+        while True:
+            result = func(*args, **kwargs)
+            object_state = get_object_state(result)
+            if state_matches(object_state, state):
+                return result
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, poll_interval)
+
+        msg = "Status check for object %s timed out" % (result)
+        raise NttCisAPIException(code=object_state, msg=msg, driver=self)
 
     def ex_get_default_health_monitors(self, network_domain):
         """
@@ -1254,11 +1549,9 @@ class NttCisLBDriver(Driver):
 
         :rtype: `list` of :class:`NttCisDefaultHealthMonitor`
         """
-        result = self.connection.request_with_orgId_api_2(
-            action="networkDomainVip/defaultHealthMonitor",
-            params={"networkDomainId": network_domain},
-            method="GET",
-        ).object
+        result = self._cached_request(
+            "networkDomainVip/defaultHealthMonitor", params={"networkDomainId": network_domain}
+        )
         return self._to_health_monitors(result)
 
     def ex_get_default_persistence_profiles(self, network_domain_id):
@@ -1270,11 +1563,10 @@ class NttCisLBDriver(Driver):
 
         :rtype: `list` of :class:`NttCisPersistenceProfile`
         """
-        result = self.connection.request_with_orgId_api_2(
-            action="networkDomainVip/defaultPersistenceProfile",
+        result = self._cached_request(
+            "networkDomainVip/defaultPersistenceProfile",
             params={"networkDomainId": network_domain_id},
-            method="GET",
-        ).object
+        )
         return self._to_persistence_profiles(result)
 
     def ex_get_default_irules(self, network_domain_id):
@@ -1286,11 +1578,9 @@ class NttCisLBDriver(Driver):
 
         :rtype: `list` of :class:`NttCisDefaultiRule`
         """
-        result = self.connection.request_with_orgId_api_2(
-            action="networkDomainVip/defaultIrule",
-            params={"networkDomainId": network_domain_id},
-            method="GET",
-        ).object
+        result = self._cached_request(
+            "networkDomainVip/defaultIrule", params={"networkDomainId": network_domain_id}
+        )
         return self._to_irules(result)
 
     @get_params
@@ -1324,7 +1614,8 @@ class NttCisLBDriver(Driver):
         :returns: :class: `NttCisdomaincertificate
         """
         result = self.connection.request_with_orgId_api_2(
-            action="networkDomainVip/sslDomainCertificate/%s" % cert_id, method="GET"
+            action="networkDomainVip/sslDomainCertificate/%s" % urlquote(cert_id, safe=""),
+            method="GET",
         ).object
         return self._to_cert(result)
 
@@ -1357,7 +1648,8 @@ class NttCisLBDriver(Driver):
         :return: :class: `NttCiscertificatechain
         """
         result = self.connection.request_with_orgId_api_2(
-            action="networkDomainVip/sslCertificateChain/%s" % chain_id, method="GET"
+            action="networkDomainVip/sslCertificateChain/%s" % urlquote(chain_id, safe=""),
+            method="GET",
         ).object
         return self._to_certificate_chain(result)
 
@@ -1388,20 +1680,56 @@ class NttCisLBDriver(Driver):
 
     def ex_get_ssl_offload_profile(self, profile_id):
         result = self.connection.request_with_orgId_api_2(
-            action="networkDomainVip/sslOffloadProfile/%s" % profile_id, method="GET"
+            action="networkDomainVip/sslOffloadProfile/%s" % urlquote(profile_id, safe=""),
+            method="GET",
         ).object
         return self._to_ssl_profile(result)
 
+    def ex_snapshot(self, network_domain_id=None):
+        """
+        Get the pools, nodes, SSL domain certificates, SSL certificate chains
+        and SSL offload profiles in one go. The five lists are requested
+        concurrently, each over a connection of its own.
+
+        :param network_domain_id: (Optional) Only return the objects of this
+                                  network domain
+        :type  network_domain_id: ``str``
+
+        :rtype: :class:`NttCisLBSnapshot`
+        """
+        if network_domain_id is None:
+            filters = {}
+        else:
+            filters = {"network_domain_id": network_domain_id}
+
+        self.connection._get_orgId()
+        pools, nodes, domain_certs, chains, offload_profiles = drivers = [
+            self._copy_with_new_connection() for _ in NttCisLBSnapshot._fields
+        ]
+        try:
+            with ThreadPoolExecutor(max_workers=len(drivers)) as executor:
+                futures = (
+                    executor.submit(pools.ex_get_pools, ex_network_domain_id=network_domain_id),
+                    executor.submit(nodes.ex_get_nodes, ex_network_domain_id=network_domain_id),
+                    executor.submit(domain_certs.ex_list_ssl_domain_certs, **filters),
+                    executor.submit(chains.ex_list_ssl_certificate_chains, **filters),
+                    executor.submit(offload_profiles.ex_list_ssl_offload_profiles, **filters),
+                )
+                return NttCisLBSnapshot(*(future.result() for future in futures))
+        finally:
+            for driver in drivers:
+                driver._close_connection()
+
     def _to_irules(self, object):
         irules = []
-        matches = object.findall(fixxpath("defaultIrule", TYPES_URN))
+        matches = object.iterfind(_DEFAULT_IRULE_TAG)
         for element in matches:
             irules.append(self._to_irule(element))
         return irules
 
     def _to_irule(self, element):
         compatible = []
-        matches = element.findall(fixxpath("virtualListenerCompatibility", TYPES_URN))
+        matches = element.iterfind(_VIRTUAL_LISTENER_COMPATIBILITY_TAG)
         for match_element in matches:
             compatible.append(
                 NttCisVirtualListenerCompatibility(
@@ -1409,7 +1737,7 @@ class NttCisLBDriver(Driver):
                     protocol=match_element.get("protocol", None),
                 )
             )
-        irule_element = element.find(fixxpath("irule", TYPES_URN))
+        irule_element = element.find(_IRULE_TAG)
         return NttCisDefaultiRule(
             id=irule_element.get("id"),
             name=irule_element.get("name"),
@@ -1418,14 +1746,14 @@ class NttCisLBDriver(Driver):
 
     def _to_persistence_profiles(self, object):
         profiles = []
-        matches = object.findall(fixxpath("defaultPersistenceProfile", TYPES_URN))
+        matches = object.iterfind(_DEFAULT_PERSISTENCE_PROFILE_TAG)
         for element in matches:
             profiles.append(self._to_persistence_profile(element))
         return profiles
 
     def _to_persistence_profile(self, element):
         compatible = []
-        matches = element.findall(fixxpath("virtualListenerCompatibility", TYPES_URN))
+        matches = element.iterfind(_VIRTUAL_LISTENER_COMPATIBILITY_TAG)
         for match_element in matches:
             compatible.append(
                 NttCisVirtualListenerCompatibility(
@@ -1436,14 +1764,14 @@ class NttCisLBDriver(Driver):
 
         return NttCisPersistenceProfile(
             id=element.get("id"),
-            fallback_compatible=bool(element.get("fallbackCompatible") == "true"),
-            name=findtext(element, "name", TYPES_URN),
+            fallback_compatible=element.get("fallbackCompatible") == "true",
+            name=element.findtext(_NAME_TAG),
             compatible_listeners=compatible,
         )
 
     def _to_health_monitors(self, object):
         monitors = []
-        matches = object.findall(fixxpath("defaultHealthMonitor", TYPES_URN))
+        matches = object.iterfind(_DEFAULT_HEALTH_MONITOR_TAG)
         for element in matches:
             monitors.append(self._to_health_monitor(element))
         return monitors
@@ -1451,72 +1779,80 @@ class NttCisLBDriver(Driver):
     def _to_health_monitor(self, element):
         return NttCisDefaultHealthMonitor(
             id=element.get("id"),
-            name=findtext(element, "name", TYPES_URN),
-            node_compatible=bool(findtext(element, "nodeCompatible", TYPES_URN) == "true"),
-            pool_compatible=bool(findtext(element, "poolCompatible", TYPES_URN) == "true"),
+            name=element.findtext(_NAME_TAG),
+            node_compatible=element.findtext(_NODE_COMPATIBLE_TAG) == "true",
+            pool_compatible=element.findtext(_POOL_COMPATIBLE_TAG) == "true",
         )
 
     def _to_nodes(self, object):
-        nodes = []
-        for element in object.findall(fixxpath("node", TYPES_URN)):
-            nodes.append(self._to_node(element))
+        return list(self._iter_nodes(object))
 
-        return nodes
+    def _iter_nodes(self, object):
+        # Resolve the converter and the state lookup once for the whole list
+        to_node = self._to_node
+        state_of = self._state_of
+        for element in object.iterfind(_NODE_TAG):
+            yield to_node(element, state_of)
 
-    def _to_node(self, element):
-        ipaddress = findtext(element, "ipv4Address", TYPES_URN)
+    def _to_node(self, element, state_of=None):
+        if state_of is None:
+            state_of = self._state_of
+
+        ipaddress = element.findtext(_IPV4_ADDRESS_TAG)
         if ipaddress is None:
-            ipaddress = findtext(element, "ipv6Address", TYPES_URN)
+            ipaddress = element.findtext(_IPV6_ADDRESS_TAG)
 
-        name = findtext(element, "name", TYPES_URN)
+        name = element.findtext(_NAME_TAG)
 
         try:
-            hm = element.find(fixxpath("healthMonitor", TYPES_URN)).get("id")
+            hm = element.find(_HEALTH_MONITOR_TAG).get("id")
         except AttributeError:
             hm = None
 
         node = NttCisVIPNode(
             id=element.get("id"),
             name=name,
-            status=self._VALUE_TO_STATE_MAP.get(
-                findtext(element, "state", TYPES_URN), State.UNKNOWN
-            ),
+            status=state_of(element.findtext(_STATE_TAG), State.UNKNOWN),
             health_monitor=hm,
-            connection_rate_limit=findtext(element, "connectionRateLimit", TYPES_URN),
-            connection_limit=findtext(element, "connectionLimit", TYPES_URN),
+            connection_rate_limit=element.findtext(_CONNECTION_RATE_LIMIT_TAG),
+            connection_limit=element.findtext(_CONNECTION_LIMIT_TAG),
             ip=ipaddress,
         )
 
         return node
 
     def _to_balancers(self, object):
-        loadbalancers = []
-        for element in object.findall(fixxpath("virtualListener", TYPES_URN)):
-            loadbalancers.append(self._to_balancer(element))
-
-        return loadbalancers
-
-    def _to_balancer(self, element):
-        ipaddress = findtext(element, "listenerIpAddress", TYPES_URN)
-        name = findtext(element, "name", TYPES_URN)
-        port = findtext(element, "port", TYPES_URN)
+        return list(self._iter_balancers(object))
+
+    def _iter_balancers(self, object):
+        # Resolve the converter and the state lookup once for the whole list
+        to_balancer = self._to_balancer
+        state_of = self._state_of
+        for element in object.iterfind(_VIRTUAL_LISTENER_TAG):
+            yield to_balancer(element, state_of)
+
+    def _to_balancer(self, element, state_of=None):
+        if state_of is None:
+            state_of = self._state_of
+
+        ipaddress = element.findtext(_LISTENER_IP_ADDRESS_TAG)
+        name = element.findtext(_NAME_TAG)
+        port = element.findtext(_PORT_TAG)
         extra = {}
 
-        pool_element = element.find(fixxpath("pool", TYPES_URN))
+        pool_element = element.find(_POOL_TAG)
         if pool_element is None:
             extra["pool_id"] = None
 
         else:
             extra["pool_id"] = pool_element.get("id")
 
-        extra["network_domain_id"] = findtext(element, "networkDomainId", TYPES_URN)
+        extra["network_domain_id"] = element.findtext(_NETWORK_DOMAIN_ID_TAG)
 
         balancer = LoadBalancer(
             id=element.get("id"),
             name=name,
-            state=self._VALUE_TO_STATE_MAP.get(
-                findtext(element, "state", TYPES_URN), State.UNKNOWN
-            ),
+            state=state_of(element.findtext(_STATE_TAG), State.UNKNOWN),
             ip=ipaddress,
             port=port,
             driver=self.connection.driver,
@@ -1526,69 +1862,62 @@ class NttCisLBDriver(Driver):
         return balancer
 
     def _to_members(self, object):
-        members = []
-        for element in object.findall(fixxpath("poolMember", TYPES_URN)):
-            members.append(self._to_member(element))
+        return list(self._iter_members(object))
 
-        return members
+    def _iter_members(self, object):
+        for element in object.iterfind(_POOL_MEMBER_TAG):
+            yield self._to_member(element)
 
     def _to_member(self, element):
-        port = findtext(element, "port", TYPES_URN)
+        port = element.findtext(_PORT_TAG)
         if port is not None:
             port = int(port)
+        node_element = element.find(_NODE_TAG)
         pool_member = NttCisPoolMember(
             id=element.get("id"),
-            name=element.find(fixxpath("node", TYPES_URN)).get("name"),
-            status=findtext(element, "state", TYPES_URN),
-            node_id=element.find(fixxpath("node", TYPES_URN)).get("id"),
-            ip=element.find(fixxpath("node", TYPES_URN)).get("ipAddress"),
+            name=node_element.get("name"),
+            status=element.findtext(_STATE_TAG),
+            node_id=node_element.get("id"),
+            ip=node_element.get("ipAddress"),
             port=port,
         )
         return pool_member
 
     def _to_pools(self, object):
-        pools = []
-        for element in object.findall(fixxpath("pool", TYPES_URN)):
-            pools.append(self._to_pool(element))
+        return list(self._iter_pools(object))
 
-        return pools
+    def _iter_pools(self, object):
+        for element in object.iterfind(_POOL_TAG):
+            yield self._to_pool(element)
 
     def _to_pool(self, element):
-        pool = NttCisPool(
-            id=element.get("id"),
-            name=findtext(element, "name", TYPES_URN),
-            status=findtext(element, "state", TYPES_URN),
-            description=findtext(element, "description", TYPES_URN),
-            load_balance_method=findtext(element, "loadBalanceMethod", TYPES_URN),
-            health_monitor_id=findtext(element, "healthMonitorId", TYPES_URN),
-            service_down_action=findtext(element, "serviceDownAction", TYPES_URN),
-            slow_ramp_time=findtext(element, "slowRampTime", TYPES_URN),
+        return NttCisPool(
+            id=element.get("id"), **{attr: element.findtext(tag) for attr, tag in _POOL_FIELDS}
         )
-        return pool
 
     def _to_certs(self, object):
         certs = []
-        for element in object.findall(fixxpath("sslDomainCertificate", TYPES_URN)):
+        for element in object.iterfind(_SSL_DOMAIN_CERTIFICATE_TAG):
             certs.append(self._to_cert(element))
         return certs
 
     def _to_cert(self, el):
-        return process_xml(ET.tostring(el))
+        return process_xml(el)
 
     def _to_certificate_chains(self, object):
         cert_chains = []
-        for element in object.findall(fixxpath("sslCertificateChain", TYPES_URN)):
+        for element in object.iterfind(_SSL_CERTIFICATE_CHAIN_TAG):
             cert_chains.append(self._to_certificate_chain(element))
         return cert_chains
 
     def _to_certificate_chain(self, el):
-        return process_xml(ET.tostring(el))
+        return process_xml(el)
 
     def _to_ssl_profiles(self, object):
         profiles = []
-        for element in object.findall(fixxpath("sslOffloadProfile", TYPES_URN)):
+        for element in object.iterfind(_SSL_OFFLOAD_PROFILE_TAG):
             profiles.append(self._to_ssl_profile(element))
         return profiles
 
     def _to_ssl_profile(self, el):
-        return process_xml(ET.tostring(el))
+        return process_xml(el)
@@ -18,11 +18,11 @@ import re
 import sys
 import datetime
 import unittest
-import traceback
+import itertools
 from unittest.mock import patch, mock_open
 
 from libcloud.test import MockHttp
-from libcloud.utils.py3 import ET, PY2, b, httplib, assertRaisesRegex
+from libcloud.utils.py3 import ET, PY2, b, httplib, parse_qs, urlparse
 from libcloud.compute.base import Node, NodeImage
 from libcloud.test.compute import TestCaseMixin
 from libcloud.test.secrets import VCLOUD_PARAMS
@@ -36,36 +36,152 @@ from libcloud.compute.drivers.vcloud import (
     ControlAccess,
     TerremarkDriver,
     VCloudNodeDriver,
+    TerremarkConnection,
+    VCloud_1_5_Connection,
     VCloud_1_5_NodeDriver,
     VCloud_5_1_NodeDriver,
+    VCloud_5_5_Connection,
     VCloud_5_5_NodeDriver,
     Instantiate_1_5_VAppXML,
-    fixxpath,
     get_url_path,
 )
 
 BUILTINS = "__builtin__" if PY2 else "builtins"
 
 
-def print_parameterized_failure(names_values):
+def _make_admin_password_section(enabled, auto, has_password):
     """
-    Print failure information for a failed, parameterized test.
-    This includes a traceback and parameter values.
+    Render a GuestCustomizationSection, leaving out the AdminPasswordEnabled
+    or AdminPasswordAuto element when ``enabled`` or ``auto`` is ``None``.
+    """
+    children = []
+    if enabled is not None:
+        children.append("<AdminPasswordEnabled>%s</AdminPasswordEnabled>" % enabled)
+    if auto is not None:
+        children.append("<AdminPasswordAuto>%s</AdminPasswordAuto>" % auto)
+    if has_password:
+        children.append("<AdminPassword>testpassword</AdminPassword>")
+    return (
+        '<GuestCustomizationSection xmlns="http://www.vmware.com/vcloud/v1.5">'
+        + "".join(children)
+        + "</GuestCustomizationSection>"
+    )
 
-    :param names_values: Name, value pairs for parameters of test at failure
-    :type names_values: ``list`` of (``str``,  ``Any``)
 
-    :return: None
-    :rtype: ``None``
-    """
-    formatted_names_values = (
-        "    {name}={value}".format(name=name, value=value) for name, value in names_values
+# (admin_pass_enabled, admin_pass_auto, has_password, pass_exists, section_xml)
+# cases for test_remove_admin_password, one per distinct section. The password
+# is only kept when it is enabled and not generated automatically. The
+# sections are built once, they still have to be parsed per case as
+# _remove_admin_password modifies them.
+ADMIN_PASSWORD_CASES = tuple(
+    (
+        enabled,
+        auto,
+        has_password,
+        (enabled, auto, has_password) == ("true", "false", True),
+        _make_admin_password_section(enabled, auto, has_password),
     )
-    traceback.print_exc()
-    print(
-        "Data values:\n{values}\n".format(values="\n".join(formatted_names_values)),
-        file=sys.stderr,
+    for enabled, auto, has_password in itertools.product(
+        ("true", "false", None), ("true", "false", None), (True, False)
     )
+)
+
+ADMIN_PASSWORD_TAG = "{http://www.vmware.com/vcloud/v1.5}AdminPassword"
+LEASE_SETTINGS_SECTION_TAG = "{http://www.vmware.com/vcloud/v1.5}LeaseSettingsSection"
+
+VAPP_D_PATH = get_url_path("https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6d")
+
+# Lease expirations of vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6d in the fixtures
+DEPLOYMENT_LEASE_EXPIRATION = datetime.datetime(2019, 10, 7, 14, 6, 29, 980725, tzinfo=UTC)
+STORAGE_LEASE_EXPIRATION = datetime.datetime(2019, 10, 8, 14, 6, 29, 980725, tzinfo=UTC)
+# Deployment time they give with the fixture 1 and 2 day leases
+DEPLOYMENT_TIME = datetime.datetime(2019, 10, 6, 14, 6, 29, 980725, tzinfo=UTC)
+
+LEASE_DEPLOYMENT_TIME_ERROR = (
+    "Cannot get time deployed. Missing complete lease and expiration information."
+)
+
+# (deployment_lease, storage_lease, deployment_lease_exp, storage_lease_exp,
+# exception, res) cases for test_lease_get_time_deployed
+LEASE_DEPLOYMENT_TIME_CASES = (
+    (None, None, None, None, True, None),
+    (None, None, None, STORAGE_LEASE_EXPIRATION, True, None),
+    (None, None, DEPLOYMENT_LEASE_EXPIRATION, None, True, None),
+    (None, None, DEPLOYMENT_LEASE_EXPIRATION, STORAGE_LEASE_EXPIRATION, True, None),
+    (None, 172800, None, None, True, None),
+    (None, 172800, None, STORAGE_LEASE_EXPIRATION, False, DEPLOYMENT_TIME),
+    (None, 172800, DEPLOYMENT_LEASE_EXPIRATION, None, True, DEPLOYMENT_TIME),
+    (None, 172800, DEPLOYMENT_LEASE_EXPIRATION, STORAGE_LEASE_EXPIRATION, False, DEPLOYMENT_TIME),
+    (86400, None, None, None, True, None),
+    (86400, None, None, STORAGE_LEASE_EXPIRATION, True, None),
+    (86400, None, DEPLOYMENT_LEASE_EXPIRATION, None, False, DEPLOYMENT_TIME),
+    (86400, None, DEPLOYMENT_LEASE_EXPIRATION, STORAGE_LEASE_EXPIRATION, False, DEPLOYMENT_TIME),
+    (86400, 172800, None, None, True, None),
+    (86400, 172800, None, STORAGE_LEASE_EXPIRATION, False, DEPLOYMENT_TIME),
+    (86400, 172800, DEPLOYMENT_LEASE_EXPIRATION, None, False, DEPLOYMENT_TIME),
+    (86400, 172800, DEPLOYMENT_LEASE_EXPIRATION, STORAGE_LEASE_EXPIRATION, False, DEPLOYMENT_TIME),
+)
+
+LEASE_A = Lease(
+    "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6a/leaseSettingsSection/",
+    deployment_lease=0,
+    storage_lease=0,
+)
+LEASE_B = Lease(
+    "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6b/leaseSettingsSection/",
+    deployment_lease=0,
+    storage_lease=0,
+)
+LEASE_D = Lease(
+    "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6d/leaseSettingsSection/",
+    deployment_lease=86400,
+    storage_lease=172800,
+    deployment_lease_expiration=DEPLOYMENT_LEASE_EXPIRATION,
+    storage_lease_expiration=STORAGE_LEASE_EXPIRATION,
+)
+
+EXPECTED_NODE_EXTRA_A = {
+    "description": None,
+    "lease_settings": LEASE_A,
+    "vdc": "MyVdc",
+    "vms": [
+        {
+            "id": "https://vm-vcloud/api/vApp/vm-dd75d1d3-5b7b-48f0-aff3-69622ab7e045",
+            "name": "testVm",
+            "state": NodeState.RUNNING,
+            "public_ips": ["65.41.67.2"],
+            "private_ips": ["65.41.67.2"],
+            "os_type": "rhel5_64Guest",
+        }
+    ],
+}
+EXPECTED_NODE_EXTRA_B = {
+    "description": None,
+    "lease_settings": LEASE_B,
+    "vdc": "MyVdc",
+    "vms": [
+        {
+            "id": "https://vm-vcloud/api/vApp/vm-dd75d1d3-5b7b-48f0-aff3-69622ab7e046",
+            "name": "testVm2",
+            "state": NodeState.RUNNING,
+            "public_ips": ["192.168.0.103"],
+            "private_ips": ["192.168.0.100"],
+            "os_type": "rhel5_64Guest",
+        }
+    ],
+}
+
+MYGROUP_SUBJECT = Subject(
+    name="MyGroup", type="group", access_level=ControlAccess.AccessLevel.FULL_CONTROL
+)
+
+
+def make_node(driver, node_id, state=NodeState.RUNNING):
+    """
+    Create a node named "testNode" with no IP addresses, for tests which
+    only pass a node on to the driver.
+    """
+    return Node(node_id, "testNode", state, [], [], driver)
 
 
 class CallException(Exception):
@@ -76,15 +192,41 @@ class CallException(Exception):
     pass
 
 
-class TerremarkTests(unittest.TestCase, TestCaseMixin):
-    def setUp(self):
-        VCloudNodeDriver.connectionCls.host = "test"
-        VCloudNodeDriver.connectionCls.conn_class = TerremarkMockHttp
-        TerremarkMockHttp.type = None
-        self.driver = TerremarkDriver(*VCLOUD_PARAMS)
+class SharedDriverMixin:
+    """
+    The driver is constructed once per test class. Tests which only need a
+    node or an image to act on share the result of the first
+    ``list_nodes()`` / ``list_images()`` call instead of parsing the
+    fixtures again.
+    """
+
+    _nodes = None
+    _images = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.driver = cls.create_driver()
+        cls._nodes = None
+        cls._images = None
+
+    def listed_nodes(self):
+        if self.__class__._nodes is None:
+            self.__class__._nodes = self.driver.list_nodes()
+        return self._nodes
+
+    def listed_images(self):
+        if self.__class__._images is None:
+            self.__class__._images = self.driver.list_images()
+        return self._images
+
+
+class TerremarkTests(SharedDriverMixin, unittest.TestCase, TestCaseMixin):
+    @classmethod
+    def create_driver(cls):
+        return TerremarkMockDriver(*VCLOUD_PARAMS)
 
     def test_list_images(self):
-        ret = self.driver.list_images()
+        ret = self.listed_images()
         self.assertEqual(
             ret[0].id,
             "https://services.vcloudexpress.terremark.com/api/v0.8/vAppTemplate/5",
@@ -95,7 +237,7 @@ class TerremarkTests(unittest.TestCase, TestCaseMixin):
         self.assertEqual(ret[0].ram, 512)
 
     def test_create_node(self):
-        image = self.driver.list_images()[0]
+        image = self.listed_images()[0]
         size = self.driver.list_sizes()[0]
         node = self.driver.create_node(
             name="testerpart2",
@@ -112,7 +254,7 @@ class TerremarkTests(unittest.TestCase, TestCaseMixin):
         self.assertEqual(node.name, "testerpart2")
 
     def test_list_nodes(self):
-        ret = self.driver.list_nodes()
+        ret = self.listed_nodes()
         node = ret[0]
         self.assertEqual(
             node.id, "https://services.vcloudexpress.terremark.com/api/v0.8/vapp/14031"
@@ -123,25 +265,42 @@ class TerremarkTests(unittest.TestCase, TestCaseMixin):
         self.assertEqual(node.private_ips, ["10.112.78.69"])
 
     def test_reboot_node(self):
-        node = self.driver.list_nodes()[0]
+        node = self.listed_nodes()[0]
         ret = self.driver.reboot_node(node)
         self.assertTrue(ret)
 
     def test_destroy_node(self):
-        node = self.driver.list_nodes()[0]
+        node = self.listed_nodes()[0]
         ret = self.driver.destroy_node(node)
         self.assertTrue(ret)
 
 
-class VCloud_1_5_Tests(unittest.TestCase, TestCaseMixin):
-    def setUp(self):
-        VCloudNodeDriver.connectionCls.host = "test"
-        VCloudNodeDriver.connectionCls.conn_class = VCloud_1_5_MockHttp
-        VCloud_1_5_MockHttp.type = None
-        self.driver = VCloud_1_5_NodeDriver(*VCLOUD_PARAMS)
+class VCloud_1_5_Tests(SharedDriverMixin, unittest.TestCase, TestCaseMixin):
+    @classmethod
+    def create_driver(cls):
+        return VCloud_1_5_MockDriver(*VCLOUD_PARAMS)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Nodes which the tests only pass on to the driver, they are never
+        # modified so one instance of each is shared by all the tests
+        cls.node_b = make_node(
+            cls.driver, "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6b"
+        )
+        cls.deploy_node = make_node(
+            cls.driver, "/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6a", state=0
+        )
+        cls.undeploy_node = make_node(cls.driver, "https://test/api/vApp/undeployTest", state=0)
+        cls.undeploy_error_node = make_node(
+            cls.driver, "https://test/api/vApp/undeployErrorTest", state=0
+        )
+        cls.undeploy_power_off_node = make_node(
+            cls.driver, "https://test/api/vApp/undeployPowerOffTest", state=0
+        )
 
     def test_list_images(self):
-        ret = self.driver.list_images()
+        ret = self.listed_images()
         self.assertEqual(
             "https://vm-vcloud/api/vAppTemplate/vappTemplate-ac1bc027-bf8c-4050-8643-4971f691c158",
             ret[0].id,
@@ -159,7 +318,7 @@ class VCloud_1_5_Tests(unittest.TestCase, TestCaseMixin):
         )
 
     def test_create_node(self):
-        image = self.driver.list_images()[0]
+        image = self.listed_images()[0]
         size = self.driver.list_sizes()[0]
         node = self.driver.create_node(
             name="testNode",
@@ -177,7 +336,7 @@ class VCloud_1_5_Tests(unittest.TestCase, TestCaseMixin):
         self.assertEqual("testNode", node.name)
 
     def test_create_node_clone(self):
-        image = self.driver.list_nodes()[0]
+        image = self.listed_nodes()[0]
         node = self.driver.create_node(name="testNode", image=image)
         self.assertTrue(isinstance(node, Node))
         self.assertEqual(
@@ -187,7 +346,7 @@ class VCloud_1_5_Tests(unittest.TestCase, TestCaseMixin):
         self.assertEqual("testNode", node.name)
 
     def test_list_nodes(self):
-        ret = self.driver.list_nodes()
+        ret = self.listed_nodes()
         node = ret[0]
         self.assertEqual(
             node.id,
@@ -197,28 +356,9 @@ class VCloud_1_5_Tests(unittest.TestCase, TestCaseMixin):
         self.assertEqual(node.state, NodeState.RUNNING)
         self.assertEqual(node.public_ips, ["65.41.67.2"])
         self.assertEqual(node.private_ips, ["65.41.67.2"])
-        self.assertEqual(
-            node.extra,
-            {
-                "description": None,
-                "lease_settings": Lease(
-                    "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6a/leaseSettingsSection/",
-                    deployment_lease=0,
-                    storage_lease=0,
-                ),
-                "vdc": "MyVdc",
-                "vms": [
-                    {
-                        "id": "https://vm-vcloud/api/vApp/vm-dd75d1d3-5b7b-48f0-aff3-69622ab7e045",
-                        "name": "testVm",
-                        "state": NodeState.RUNNING,
-                        "public_ips": ["65.41.67.2"],
-                        "private_ips": ["65.41.67.2"],
-                        "os_type": "rhel5_64Guest",
-                    }
-                ],
-            },
-        )
+        self.assertEqual(node.extra["lease_settings"], LEASE_A)
+        self.assertEqual(node.extra["vms"][0]["id"], EXPECTED_NODE_EXTRA_A["vms"][0]["id"])
+        self.assertEqual(node.extra, EXPECTED_NODE_EXTRA_A)
         node = ret[1]
         self.assertEqual(
             node.id,
@@ -228,36 +368,17 @@ class VCloud_1_5_Tests(unittest.TestCase, TestCaseMixin):
         self.assertEqual(node.state, NodeState.RUNNING)
         self.assertEqual(node.public_ips, ["192.168.0.103"])
         self.assertEqual(node.private_ips, ["192.168.0.100"])
-        self.assertEqual(
-            node.extra,
-            {
-                "description": None,
-                "lease_settings": Lease(
-                    "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6b/leaseSettingsSection/",
-                    deployment_lease=0,
-                    storage_lease=0,
-                ),
-                "vdc": "MyVdc",
-                "vms": [
-                    {
-                        "id": "https://vm-vcloud/api/vApp/vm-dd75d1d3-5b7b-48f0-aff3-69622ab7e046",
-                        "name": "testVm2",
-                        "state": NodeState.RUNNING,
-                        "public_ips": ["192.168.0.103"],
-                        "private_ips": ["192.168.0.100"],
-                        "os_type": "rhel5_64Guest",
-                    }
-                ],
-            },
-        )
+        self.assertEqual(node.extra["lease_settings"], LEASE_B)
+        self.assertEqual(node.extra["vms"][0]["id"], EXPECTED_NODE_EXTRA_B["vms"][0]["id"])
+        self.assertEqual(node.extra, EXPECTED_NODE_EXTRA_B)
 
     def test_reboot_node(self):
-        node = self.driver.list_nodes()[0]
+        node = self.listed_nodes()[0]
         ret = self.driver.reboot_node(node)
         self.assertTrue(ret)
 
     def test_destroy_node(self):
-        node = self.driver.list_nodes()[0]
+        node = self.listed_nodes()[0]
         ret = self.driver.destroy_node(node)
         self.assertTrue(ret)
 
@@ -284,70 +405,27 @@ class VCloud_1_5_Tests(unittest.TestCase, TestCaseMixin):
         )
 
     def test_is_node(self):
-        self.assertTrue(
-            self.driver._is_node(
-                Node(
-                    "testId",
-                    "testNode",
-                    state=0,
-                    public_ips=[],
-                    private_ips=[],
-                    driver=self.driver,
-                )
-            )
-        )
+        self.assertTrue(self.driver._is_node(make_node(self.driver, "testId", state=0)))
         self.assertFalse(self.driver._is_node(NodeImage("testId", "testNode", driver=self.driver)))
 
     def test_ex_deploy(self):
         node = self.driver.ex_deploy_node(
-            Node(
-                "/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6a",
-                "testNode",
-                state=0,
-                public_ips=[],
-                private_ips=[],
-                driver=self.driver,
-            ),
+            self.deploy_node,
             ex_force_customization=False,
         )
         self.assertEqual(node.state, NodeState.RUNNING)
 
     def test_ex_undeploy(self):
-        node = self.driver.ex_undeploy_node(
-            Node(
-                "https://test/api/vApp/undeployTest",
-                "testNode",
-                state=0,
-                public_ips=[],
-                private_ips=[],
-                driver=self.driver,
-            )
-        )
+        node = self.driver.ex_undeploy_node(self.undeploy_node)
         self.assertEqual(node.state, NodeState.STOPPED)
 
     def test_ex_undeploy_with_error(self):
-        node = self.driver.ex_undeploy_node(
-            Node(
-                "https://test/api/vApp/undeployErrorTest",
-                "testNode",
-                state=0,
-                public_ips=[],
-                private_ips=[],
-                driver=self.driver,
-            )
-        )
+        node = self.driver.ex_undeploy_node(self.undeploy_error_node)
         self.assertEqual(node.state, NodeState.STOPPED)
 
     def test_ex_undeploy_power_off(self):
         node = self.driver.ex_undeploy_node(
-            Node(
-                "https://test/api/vApp/undeployPowerOffTest",
-                "testNode",
-                state=0,
-                public_ips=[],
-                private_ips=[],
-                driver=self.driver,
-            ),
+            self.undeploy_power_off_node,
             shutdown=False,
         )
         self.assertEqual(node.state, NodeState.STOPPED)
@@ -400,7 +478,7 @@ class VCloud_1_5_Tests(unittest.TestCase, TestCaseMixin):
         self.assertEqual(vdcs[0].memory.units, "MB")
 
     def test_ex_list_nodes(self):
-        self.assertEqual(len(self.driver.ex_list_nodes()), len(self.driver.list_nodes()))
+        self.assertEqual(len(self.driver.ex_list_nodes()), len(self.listed_nodes()))
 
     def test_ex_list_nodes__masked_exception(self):
         """
@@ -410,14 +488,7 @@ class VCloud_1_5_Tests(unittest.TestCase, TestCaseMixin):
         self.assertRaises(AnotherError, self.driver.ex_list_nodes, (brokenVdc))
 
     def test_ex_power_off(self):
-        node = Node(
-            "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6b",
-            "testNode",
-            NodeState.RUNNING,
-            [],
-            [],
-            self.driver,
-        )
+        node = self.node_b
         self.driver.ex_power_off_node(node)
 
     def test_ex_query(self):
@@ -430,14 +501,7 @@ class VCloud_1_5_Tests(unittest.TestCase, TestCaseMixin):
         self.assertEqual(results[0]["isLdapUser"], "true")
 
     def test_ex_get_control_access(self):
-        node = Node(
-            "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6b",
-            "testNode",
-            NodeState.RUNNING,
-            [],
-            [],
-            self.driver,
-        )
+        node = self.node_b
         control_access = self.driver.ex_get_control_access(node)
         self.assertEqual(control_access.everyone_access_level, ControlAccess.AccessLevel.READ_ONLY)
         self.assertEqual(len(control_access.subjects), 1)
@@ -453,48 +517,17 @@ class VCloud_1_5_Tests(unittest.TestCase, TestCaseMixin):
         )
 
     def test_ex_set_control_access(self):
-        node = Node(
-            "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6b",
-            "testNode",
-            NodeState.RUNNING,
-            [],
-            [],
-            self.driver,
-        )
-        control_access = ControlAccess(
-            node,
-            None,
-            [
-                Subject(
-                    name="MyGroup",
-                    type="group",
-                    access_level=ControlAccess.AccessLevel.FULL_CONTROL,
-                )
-            ],
-        )
+        node = self.node_b
+        control_access = ControlAccess(node, None, [MYGROUP_SUBJECT])
         self.driver.ex_set_control_access(node, control_access)
 
     def test_ex_get_metadata(self):
-        node = Node(
-            "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6b",
-            "testNode",
-            NodeState.RUNNING,
-            [],
-            [],
-            self.driver,
-        )
+        node = self.node_b
         metadata = self.driver.ex_get_metadata(node)
         self.assertEqual(metadata, {"owners": "msamia@netsuite.com"})
 
     def test_ex_set_metadata_entry(self):
-        node = Node(
-            "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6b",
-            "testNode",
-            NodeState.RUNNING,
-            [],
-            [],
-            self.driver,
-        )
+        node = self.node_b
         self.driver.ex_set_metadata_entry(node, "foo", "bar")
 
     def test_ex_find_vm_nodes(self):
@@ -532,110 +565,38 @@ class VCloud_1_5_Tests(unittest.TestCase, TestCaseMixin):
         node = self.driver._ex_get_node(
             "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6a"
         )
-        lease = Lease(
-            "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6a/leaseSettingsSection/",
-            deployment_lease=0,
-            storage_lease=0,
-        )
-        self.assertEqual(node.extra["lease_settings"], lease)
+        self.assertEqual(node.extra["lease_settings"], LEASE_A)
         node = self.driver._ex_get_node(
             "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6d"
         )
-        # 2019-10-07T14:06:29.980725
-        lease = Lease(
-            "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6d/leaseSettingsSection/",
-            deployment_lease=86400,
-            storage_lease=172800,
-            deployment_lease_expiration=datetime.datetime(
-                year=2019,
-                month=10,
-                day=7,
-                hour=14,
-                minute=6,
-                second=29,
-                microsecond=980725,
-                tzinfo=UTC,
-            ),
-            storage_lease_expiration=datetime.datetime(
-                year=2019,
-                month=10,
-                day=8,
-                hour=14,
-                minute=6,
-                second=29,
-                microsecond=980725,
-                tzinfo=UTC,
-            ),
-        )
-        self.assertEqual(node.extra["lease_settings"], lease)
+        self.assertEqual(node.extra["lease_settings"], LEASE_D)
 
     def test_remove_admin_password(self):
-        pass_enabled_xml = "<AdminPasswordEnabled>{text}</AdminPasswordEnabled>"
-        pass_enabled_true = pass_enabled_xml.format(text="true")
-        pass_enabled_false = pass_enabled_xml.format(text="false")
-        pass_auto_xml = "<AdminPasswordAuto>{text}</AdminPasswordAuto>"
-        pass_auto_true = pass_auto_xml.format(text="true")
-        pass_auto_false = pass_auto_xml.format(text="false")
-        passwd = "<AdminPassword>testpassword</AdminPassword>"
-        assertion_error = False
-
-        for admin_pass_enabled, admin_pass_auto, admin_pass, pass_exists in (
-            (pass_enabled_true, pass_auto_true, passwd, False),
-            (pass_enabled_true, pass_auto_true, "", False),
-            (pass_enabled_true, pass_auto_false, passwd, True),
-            (pass_enabled_true, pass_auto_false, "", False),
-            (pass_enabled_true, "", passwd, False),
-            (pass_enabled_true, "", "", False),
-            (pass_enabled_false, pass_auto_true, passwd, False),
-            (pass_enabled_false, pass_auto_true, "", False),
-            (pass_enabled_false, pass_auto_false, passwd, False),
-            (pass_enabled_false, pass_auto_false, "", False),
-            (pass_enabled_false, "", passwd, False),
-            (pass_enabled_false, "", "", False),
-            ("", pass_auto_true, passwd, False),
-            ("", pass_auto_true, "", False),
-            ("", pass_auto_false, passwd, False),
-            ("", pass_auto_false, "", False),
-            ("", "", passwd, False),
-            ("", "", "", False),
-        ):
-            try:
-                guest_customization_section = ET.fromstring(
-                    '<GuestCustomizationSection xmlns="http://www.vmware.com/vcloud/v1.5">'
-                    + admin_pass_enabled
-                    + admin_pass_auto
-                    + admin_pass
-                    + "</GuestCustomizationSection>"
-                )
+        for (
+            admin_pass_enabled,
+            admin_pass_auto,
+            has_password,
+            pass_exists,
+            section_xml,
+        ) in ADMIN_PASSWORD_CASES:
+            with self.subTest(
+                admin_pass_enabled=admin_pass_enabled,
+                admin_pass_auto=admin_pass_auto,
+                admin_pass=has_password,
+                pass_exists=pass_exists,
+            ):
+                guest_customization_section = ET.fromstring(section_xml)
                 self.driver._remove_admin_password(guest_customization_section)
-                admin_pass_element = guest_customization_section.find(
-                    fixxpath(guest_customization_section, "AdminPassword")
-                )
+                admin_pass_element = guest_customization_section.find(ADMIN_PASSWORD_TAG)
                 if pass_exists:
                     self.assertIsNotNone(admin_pass_element)
                 else:
                     self.assertIsNone(admin_pass_element)
-            except AssertionError:
-                assertion_error = True
-                print_parameterized_failure(
-                    [
-                        ("admin_pass_enabled", admin_pass_enabled),
-                        ("admin_pass_auto", admin_pass_auto),
-                        ("admin_pass", admin_pass),
-                        ("pass_exists", pass_exists),
-                    ]
-                )
-
-        if assertion_error:
-            self.fail(msg="Assertion error(s) encountered. Details above.")
-
-    @patch(
-        "libcloud.compute.drivers.vcloud.VCloud_1_5_NodeDriver._get_vm_elements",
-        side_effect=CallException("Called"),
-    )
-    def test_change_vm_script_text_and_file_logic(self, _):
-        assertion_error = False
 
+    @patch.object(VCloud_1_5_NodeDriver, "_get_vm_elements", side_effect=CallException("Called"))
+    @patch(BUILTINS + ".open")
+    def test_change_vm_script_text_and_file_logic(self, mocked_open, _):
+        succeeding_open = mock_open(read_data="script text")
         for (
             vm_script_file,
             vm_script_text,
@@ -652,37 +613,26 @@ class VCloud_1_5_Tests(unittest.TestCase, TestCaseMixin):
             ("file.sh", "script text", True, 0, False),
             ("file.sh", "script text", False, 0, False),
         ):
-            try:
-                if open_succeeds:
-                    open_mock = patch(BUILTINS + ".open", mock_open(read_data="script text"))
-                else:
-                    open_mock = patch(BUILTINS + ".open", side_effect=Exception())
-                with open_mock as mocked_open:
-                    try:
-                        self.driver._change_vm_script(
-                            "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6d",
-                            vm_script=vm_script_file,
-                            vm_script_text=vm_script_text,
-                        )
-                        returned_early_res = True
-                    except CallException:
-                        returned_early_res = False
-                    self.assertEqual(mocked_open.call_count, open_call_count)
-                    self.assertEqual(returned_early_res, returned_early)
-            except AssertionError:
-                assertion_error = True
-                print_parameterized_failure(
-                    [
-                        ("vm_script_file", vm_script_file),
-                        ("vm_script_text", vm_script_text),
-                        ("open_succeeds", open_succeeds),
-                        ("open_call_count", open_call_count),
-                        ("returned_early", returned_early),
-                    ]
-                )
-
-        if assertion_error:
-            self.fail(msg="Assertion error(s) encountered. Details above.")
+            with self.subTest(
+                vm_script_file=vm_script_file,
+                vm_script_text=vm_script_text,
+                open_succeeds=open_succeeds,
+                open_call_count=open_call_count,
+                returned_early=returned_early,
+            ):
+                mocked_open.reset_mock()
+                mocked_open.side_effect = succeeding_open if open_succeeds else Exception()
+                try:
+                    self.driver._change_vm_script(
+                        "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6d",
+                        vm_script=vm_script_file,
+                        vm_script_text=vm_script_text,
+                    )
+                    returned_early_res = True
+                except CallException:
+                    returned_early_res = False
+                self.assertEqual(mocked_open.call_count, open_call_count)
+                self.assertEqual(returned_early_res, returned_early)
 
     def test_build_xmltree_description(self):
         instantiate_xml = Instantiate_1_5_VAppXML(
@@ -712,74 +662,18 @@ class VCloud_1_5_Tests(unittest.TestCase, TestCaseMixin):
 
     def test_to_lease(self):
         res = self.driver.connection.request(
-            get_url_path("https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6d"),
+            VAPP_D_PATH,
             headers={"Content-Type": "application/vnd.vmware.vcloud.vApp+xml"},
         )
-        lease_settings_section = res.object.find(fixxpath(res.object, "LeaseSettingsSection"))
+        lease_settings_section = res.object.find(LEASE_SETTINGS_SECTION_TAG)
         lease = Lease.to_lease(lease_element=lease_settings_section)
 
         self.assertEqual(lease.deployment_lease, 86400)
-        self.assertEqual(
-            lease.deployment_lease_expiration,
-            datetime.datetime(
-                year=2019,
-                month=10,
-                day=7,
-                hour=14,
-                minute=6,
-                second=29,
-                microsecond=980725,
-                tzinfo=UTC,
-            ),
-        )
+        self.assertEqual(lease.deployment_lease_expiration, DEPLOYMENT_LEASE_EXPIRATION)
         self.assertEqual(lease.storage_lease, 172800)
-        self.assertEqual(
-            lease.storage_lease_expiration,
-            datetime.datetime(
-                year=2019,
-                month=10,
-                day=8,
-                hour=14,
-                minute=6,
-                second=29,
-                microsecond=980725,
-                tzinfo=UTC,
-            ),
-        )
+        self.assertEqual(lease.storage_lease_expiration, STORAGE_LEASE_EXPIRATION)
 
     def test_lease_get_time_deployed(self):
-        deployment_datetime = datetime.datetime(
-            year=2019,
-            month=10,
-            day=6,
-            hour=14,
-            minute=6,
-            second=29,
-            microsecond=980725,
-            tzinfo=UTC,
-        )
-        deployment_lease_exp_actual = datetime.datetime(
-            year=2019,
-            month=10,
-            day=7,
-            hour=14,
-            minute=6,
-            second=29,
-            microsecond=980725,
-            tzinfo=UTC,
-        )
-        storage_lease_exp_actual = datetime.datetime(
-            year=2019,
-            month=10,
-            day=8,
-            hour=14,
-            minute=6,
-            second=29,
-            microsecond=980725,
-            tzinfo=UTC,
-        )
-        assertion_error = False
-
         for (
             deployment_lease,
             storage_lease,
@@ -787,74 +681,15 @@ class VCloud_1_5_Tests(unittest.TestCase, TestCaseMixin):
             storage_lease_exp,
             exception,
             res,
-        ) in (
-            (None, None, None, None, True, None),
-            (None, None, None, storage_lease_exp_actual, True, None),
-            (None, None, deployment_lease_exp_actual, None, True, None),
-            (
-                None,
-                None,
-                deployment_lease_exp_actual,
-                storage_lease_exp_actual,
-                True,
-                None,
-            ),
-            (None, 172800, None, None, True, None),
-            (None, 172800, None, storage_lease_exp_actual, False, deployment_datetime),
-            (
-                None,
-                172800,
-                deployment_lease_exp_actual,
-                None,
-                True,
-                deployment_datetime,
-            ),
-            (
-                None,
-                172800,
-                deployment_lease_exp_actual,
-                storage_lease_exp_actual,
-                False,
-                deployment_datetime,
-            ),
-            (86400, None, None, None, True, None),
-            (86400, None, None, storage_lease_exp_actual, True, None),
-            (
-                86400,
-                None,
-                deployment_lease_exp_actual,
-                None,
-                False,
-                deployment_datetime,
-            ),
-            (
-                86400,
-                None,
-                deployment_lease_exp_actual,
-                storage_lease_exp_actual,
-                False,
-                deployment_datetime,
-            ),
-            (86400, 172800, None, None, True, None),
-            (86400, 172800, None, storage_lease_exp_actual, False, deployment_datetime),
-            (
-                86400,
-                172800,
-                deployment_lease_exp_actual,
-                None,
-                False,
-                deployment_datetime,
-            ),
-            (
-                86400,
-                172800,
-                deployment_lease_exp_actual,
-                storage_lease_exp_actual,
-                False,
-                deployment_datetime,
-            ),
-        ):
-            try:
+        ) in LEASE_DEPLOYMENT_TIME_CASES:
+            with self.subTest(
+                deployment_lease=deployment_lease,
+                storage_lease=storage_lease,
+                deployment_lease_exp=deployment_lease_exp,
+                storage_lease_exp=storage_lease_exp,
+                exception=exception,
+                res=res,
+            ):
                 lease = Lease(
                     "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6a/leaseSettingsSection/",
                     deployment_lease=deployment_lease,
@@ -864,68 +699,49 @@ class VCloud_1_5_Tests(unittest.TestCase, TestCaseMixin):
                 )
 
                 if exception:
-                    with assertRaisesRegex(
-                        self,
-                        Exception,
-                        re.escape(
-                            "Cannot get time deployed. Missing complete lease and expiration information."
-                        ),
-                    ):
+                    with self.assertRaises(Exception) as context:
                         lease.get_deployment_time()
+                    self.assertIn(LEASE_DEPLOYMENT_TIME_ERROR, str(context.exception))
                 else:
                     self.assertEqual(lease.get_deployment_time(), res)
-            except AssertionError:
-                assertion_error = True
-                print_parameterized_failure(
-                    [
-                        ("deployment_lease", deployment_lease),
-                        ("storage_lease", storage_lease),
-                        ("deployment_lease_exp", deployment_lease_exp),
-                        ("storage_lease_exp", storage_lease_exp),
-                        ("exception", exception),
-                        ("res", res),
-                    ]
-                )
 
-        if assertion_error:
-            self.fail(msg="Assertion error(s) encountered. Details above.")
 
+class VCloud_5_1_Tests(SharedDriverMixin, unittest.TestCase, TestCaseMixin):
+    @classmethod
+    def create_driver(cls):
+        return VCloud_5_1_MockDriver(*VCLOUD_PARAMS)
 
-class VCloud_5_1_Tests(unittest.TestCase, TestCaseMixin):
-    def setUp(self):
-        VCloudNodeDriver.connectionCls.host = "test"
-        VCloudNodeDriver.connectionCls.conn_class = VCloud_1_5_MockHttp
-        VCloud_1_5_MockHttp.type = None
-        self.driver = VCloudNodeDriver(*VCLOUD_PARAMS, **{"api_version": "5.1"})
-
-        self.assertTrue(isinstance(self.driver, VCloud_5_1_NodeDriver))
+    def test_api_version(self):
+        driver = VCloudNodeDriver(*VCLOUD_PARAMS, **{"api_version": "5.1"})
+        self.assertTrue(isinstance(driver, VCloud_5_1_NodeDriver))
 
     def _test_create_node_valid_ex_vm_memory(self):
         # TODO: Hook up the fixture
         values = [4, 1024, 4096]
 
-        image = self.driver.list_images()[0]
+        image = self.listed_images()[0]
         size = self.driver.list_sizes()[0]
 
         for value in values:
-            self.driver.create_node(
-                name="testerpart2",
-                image=image,
-                size=size,
-                vdc="https://services.vcloudexpress.terremark.com/api/v0.8/vdc/224",
-                network="https://services.vcloudexpress.terremark.com/api/v0.8/network/725",
-                cpus=2,
-                ex_vm_memory=value,
-            )
+            with self.subTest(value=value):
+                self.driver.create_node(
+                    name="testerpart2",
+                    image=image,
+                    size=size,
+                    vdc="https://services.vcloudexpress.terremark.com/api/v0.8/vdc/224",
+                    network="https://services.vcloudexpress.terremark.com/api/v0.8/network/725",
+                    cpus=2,
+                    ex_vm_memory=value,
+                )
 
     def test_create_node_invalid_ex_vm_memory(self):
         values = [1, 3, 7]
 
-        image = self.driver.list_images()[0]
+        image = self.listed_images()[0]
         size = self.driver.list_sizes()[0]
 
         for value in values:
-            try:
+            with self.subTest(value=value), self.assertRaises(ValueError):
                 self.driver.create_node(
                     name="testerpart2",
                     image=image,
@@ -935,60 +751,40 @@ class VCloud_5_1_Tests(unittest.TestCase, TestCaseMixin):
                     cpus=2,
                     ex_vm_memory=value,
                 )
-            except ValueError:
-                pass
-            else:
-                self.fail("Exception was not thrown")
 
     def test_list_images(self):
-        ret = self.driver.list_images()
+        ret = self.listed_images()
         self.assertEqual(
             "https://vm-vcloud/api/vAppTemplate/vappTemplate-ac1bc027-bf8c-4050-8643-4971f691c158",
             ret[0].id,
         )
 
 
-class VCloud_5_5_Tests(unittest.TestCase, TestCaseMixin):
-    def setUp(self):
-        VCloudNodeDriver.connectionCls.host = "test"
-        VCloudNodeDriver.connectionCls.conn_class = VCloud_5_5_MockHttp
-        VCloud_5_5_MockHttp.type = None
-        self.driver = VCloudNodeDriver(*VCLOUD_PARAMS, **{"api_version": "5.5"})
+class VCloud_5_5_Tests(SharedDriverMixin, unittest.TestCase, TestCaseMixin):
+    @classmethod
+    def create_driver(cls):
+        return VCloud_5_5_MockDriver(*VCLOUD_PARAMS)
 
-        self.assertTrue(isinstance(self.driver, VCloud_5_5_NodeDriver))
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The vApp the snapshot tests act on, it is never modified
+        cls.node_b = make_node(
+            cls.driver, "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6b"
+        )
+
+    def test_api_version(self):
+        driver = VCloudNodeDriver(*VCLOUD_PARAMS, **{"api_version": "5.5"})
+        self.assertTrue(isinstance(driver, VCloud_5_5_NodeDriver))
 
     def test_ex_create_snapshot(self):
-        node = Node(
-            "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6b",
-            "testNode",
-            NodeState.RUNNING,
-            [],
-            [],
-            self.driver,
-        )
-        self.driver.ex_create_snapshot(node)
+        self.driver.ex_create_snapshot(self.node_b)
 
     def test_ex_remove_snapshots(self):
-        node = Node(
-            "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6b",
-            "testNode",
-            NodeState.RUNNING,
-            [],
-            [],
-            self.driver,
-        )
-        self.driver.ex_remove_snapshots(node)
+        self.driver.ex_remove_snapshots(self.node_b)
 
     def test_ex_revert_to_snapshot(self):
-        node = Node(
-            "https://vm-vcloud/api/vApp/vapp-8c57a5b6-e61b-48ca-8a78-3b70ee65ef6b",
-            "testNode",
-            NodeState.RUNNING,
-            [],
-            [],
-            self.driver,
-        )
-        self.driver.ex_revert_to_snapshot(node)
+        self.driver.ex_revert_to_snapshot(self.node_b)
 
     def test_ex_acquire_mks_ticket(self):
         node = self.driver.ex_find_node("testNode")
@@ -999,8 +795,26 @@ class VCloud_5_5_Tests(unittest.TestCase, TestCaseMixin):
         self.assertEqual(headers["Accept"], "application/*+xml;version=5.5")
 
 
+class CachedComputeFileFixtures(ComputeFileFixtures):
+    """
+    Fixtures which are read from disk only once, the same responses are
+    served many times over the course of the tests.
+    """
+
+    def __init__(self, sub_dir=""):
+        super().__init__(sub_dir=sub_dir)
+        self._cache = {}
+
+    def load(self, file):
+        try:
+            return self._cache[file]
+        except KeyError:
+            content = self._cache[file] = super().load(file)
+            return content
+
+
 class TerremarkMockHttp(MockHttp):
-    fixtures = ComputeFileFixtures("terremark")
+    fixtures = CachedComputeFileFixtures("terremark")
 
     def _api_v0_8_login(self, method, url, body, headers):
         headers["set-cookie"] = "vcloud-token=testtoken"
@@ -1075,18 +889,130 @@ class AnotherError(Exception):
     pass
 
 
-class VCloud_1_5_MockHttp(MockHttp, unittest.TestCase):
-    fixtures = ComputeFileFixtures("vcloud_1_5")
+class VCloud_1_5_MockHttp(MockHttp):
+    fixtures = CachedComputeFileFixtures("vcloud_1_5")
+
+    # Parsed once, the driver only reads the error element it is raised with
+    _forbidden_error = ET.fromstring(
+        fixtures.load("api_vApp_vapp_access_to_resource_forbidden.xml")
+    )
+
+    # The ControlAccessParams ex_set_control_access is expected to send
+    _control_access_body = re.compile(
+        b"<IsSharedToEveryone>false</IsSharedToEveryone>.*?"
+        b'<Subject href="https://vm-vcloud/api/admin/group/b8202c48-7151-4e61-9a6c-155474c7d413" />.*?'
+        b"<AccessLevel>FullControl</AccessLevel>",
+        re.DOTALL,
+    )
+
+    # Handlers which only return a fixture, by mock method name:
+    # name -> (fixture, status)
+    _fixture_routes = {
+        "_api_org": ("api_org.xml", httplib.OK),
+        "_api_org_96726c78_4ae3_402f_b08b_7a78c6903d2a": (
+            "api_org_96726c78_4ae3_402f_b08b_7a78c6903d2a.xml",
+            httplib.OK,
+        ),
+        "_api_network_dca8b667_6c8f_4c3e_be57_7a9425dba4f4": (
+            "api_network_dca8b667_6c8f_4c3e_be57_7a9425dba4f4.xml",
+            httplib.OK,
+        ),
+        "_api_vdc_3d9ae28c_1de9_4307_8107_9356ff8ba6d0": (
+            "api_vdc_3d9ae28c_1de9_4307_8107_9356ff8ba6d0.xml",
+            httplib.OK,
+        ),
+        "_api_vdc_brokenVdc": ("api_vdc_brokenVdc.xml", httplib.OK),
+        "_api_vdc_3d9ae28c_1de9_4307_8107_9356ff8ba6d0_action_instantiateVAppTemplate": (
+            "api_vdc_3d9ae28c_1de9_4307_8107_9356ff8ba6d0_action_instantiateVAppTemplate.xml",
+            httplib.ACCEPTED,
+        ),
+        "_api_vdc_3d9ae28c_1de9_4307_8107_9356ff8ba6d0_action_cloneVApp": (
+            "api_vdc_3d9ae28c_1de9_4307_8107_9356ff8ba6d0_action_cloneVApp.xml",
+            httplib.ACCEPTED,
+        ),
+        "_api_vApp_vm_dd75d1d3_5b7b_48f0_aff3_69622ab7e045_networkConnectionSection": (
+            "api_task_b034df55_fe81_4798_bc81_1f0fd0ead450.xml",
+            httplib.ACCEPTED,
+        ),
+        "_api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6b": (
+            "api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6b.xml",
+            httplib.OK,
+        ),
+        "_api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6c": (
+            "api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6c.xml",
+            httplib.OK,
+        ),
+        "_api_vApp_vm_dd75d1d3_5b7b_48f0_aff3_69622ab7e045": (
+            "put_api_vApp_vm_dd75d1d3_5b7b_48f0_aff3_69622ab7e045_guestCustomizationSection.xml",
+            httplib.ACCEPTED,
+        ),
+        "_api_task_b034df55_fe81_4798_bc81_1f0fd0ead450": (
+            "api_task_b034df55_fe81_4798_bc81_1f0fd0ead450.xml",
+            httplib.OK,
+        ),
+        "_api_catalog_cddb3cb2_3394_4b14_b831_11fbc4028da4": (
+            "api_catalog_cddb3cb2_3394_4b14_b831_11fbc4028da4.xml",
+            httplib.OK,
+        ),
+        "_api_catalogItem_3132e037_759b_4627_9056_ca66466fa607": (
+            "api_catalogItem_3132e037_759b_4627_9056_ca66466fa607.xml",
+            httplib.OK,
+        ),
+        "_api_vApp_deployTest": ("api_task_deploy.xml", httplib.OK),
+        "_api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6a_action_deploy": (
+            "api_task_deploy.xml",
+            httplib.ACCEPTED,
+        ),
+        "_api_task_deploy": ("api_task_deploy.xml", httplib.ACCEPTED),
+        "_api_vApp_undeployTest": ("api_vApp_undeployTest.xml", httplib.OK),
+        "_api_vApp_undeployTest_action_undeploy": ("api_task_undeploy.xml", httplib.ACCEPTED),
+        "_api_task_undeploy": ("api_task_undeploy.xml", httplib.OK),
+        "_api_vApp_undeployErrorTest": ("api_vApp_undeployTest.xml", httplib.OK),
+        "_api_task_undeployError": ("api_task_undeploy_error.xml", httplib.OK),
+        "_api_vApp_vm_test": ("api_vApp_vm_test.xml", httplib.OK),
+        "_api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6b_controlAccess": (
+            "api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6a_controlAccess.xml",
+            httplib.OK,
+        ),
+        "_api_admin_group_b8202c48_7151_4e61_9a6c_155474c7d413": (
+            "api_admin_group_b8202c48_7151_4e61_9a6c_155474c7d413.xml",
+            httplib.OK,
+        ),
+        "_api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6d": (
+            "api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6d.xml",
+            httplib.OK,
+        ),
+        "_api_vApp_undeployPowerOffTest": ("api_vApp_undeployTest.xml", httplib.OK),
+    }
+
+    # (path, type) -> mock method name, shared by all instances. The vCloud
+    # mocks don't set use_param, so the name only depends on those two.
+    _method_names = {}
+
+    def _get_method_name(self, type, use_param, qs, path):
+        key = (path, type)
+        try:
+            return self._method_names[key]
+        except KeyError:
+            meth_name = super()._get_method_name(type, use_param, qs, path)
+            self._method_names[key] = meth_name
+            return meth_name
+
+    def __getattr__(self, name):
+        try:
+            fixture, status = self._fixture_routes[name]
+        except KeyError:
+            raise AttributeError(name)
+
+        def handler(method, url, body, headers):
+            return status, self.fixtures.load(fixture), headers, httplib.responses[status]
+
+        return handler
 
     def request(self, method, url, body=None, headers=None, raw=False, stream=False):
-        self.assertTrue(
-            url.startswith("/api/"),
-            (
-                '"%s" is invalid. Needs to '
-                'start with "/api". The passed URL should be just '
-                "the path, not full URL.",
-                url,
-            ),
+        assert url.startswith("/api/"), (
+            '"%s" is invalid. Needs to start with "/api". The passed URL should be just '
+            "the path, not full URL." % url
         )
         super().request(method, url, body, headers, raw)
 
@@ -1095,60 +1021,10 @@ class VCloud_1_5_MockHttp(MockHttp, unittest.TestCase):
         body = self.fixtures.load("api_sessions.xml")
         return httplib.OK, body, headers, httplib.responses[httplib.OK]
 
-    def _api_org(self, method, url, body, headers):
-        body = self.fixtures.load("api_org.xml")
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
-
-    def _api_org_96726c78_4ae3_402f_b08b_7a78c6903d2a(self, method, url, body, headers):
-        body = self.fixtures.load("api_org_96726c78_4ae3_402f_b08b_7a78c6903d2a.xml")
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
-
-    def _api_network_dca8b667_6c8f_4c3e_be57_7a9425dba4f4(self, method, url, body, headers):
-        body = self.fixtures.load("api_network_dca8b667_6c8f_4c3e_be57_7a9425dba4f4.xml")
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
-
-    def _api_vdc_3d9ae28c_1de9_4307_8107_9356ff8ba6d0(self, method, url, body, headers):
-        body = self.fixtures.load("api_vdc_3d9ae28c_1de9_4307_8107_9356ff8ba6d0.xml")
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
-
-    def _api_vdc_brokenVdc(self, method, url, body, headers):
-        body = self.fixtures.load("api_vdc_brokenVdc.xml")
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
-
     def _api_vApp_vapp_errorRaiser(self, method, url, body, headers):
         m = AnotherErrorMember()
         raise AnotherError(m)
 
-    def _api_vdc_3d9ae28c_1de9_4307_8107_9356ff8ba6d0_action_instantiateVAppTemplate(
-        self, method, url, body, headers
-    ):
-        body = self.fixtures.load(
-            "api_vdc_3d9ae28c_1de9_4307_8107_9356ff8ba6d0_action_instantiateVAppTemplate.xml"
-        )
-        return httplib.ACCEPTED, body, headers, httplib.responses[httplib.ACCEPTED]
-
-    def _api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6a_power_action_powerOn(
-        self, method, url, body, headers
-    ):
-        return self._api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6b_power_action_all(
-            method, url, body, headers
-        )
-
-    # Clone
-    def _api_vdc_3d9ae28c_1de9_4307_8107_9356ff8ba6d0_action_cloneVApp(
-        self, method, url, body, headers
-    ):
-        body = self.fixtures.load(
-            "api_vdc_3d9ae28c_1de9_4307_8107_9356ff8ba6d0_action_cloneVApp.xml"
-        )
-        return httplib.ACCEPTED, body, headers, httplib.responses[httplib.ACCEPTED]
-
-    def _api_vApp_vm_dd75d1d3_5b7b_48f0_aff3_69622ab7e045_networkConnectionSection(
-        self, method, url, body, headers
-    ):
-        body = self.fixtures.load("api_task_b034df55_fe81_4798_bc81_1f0fd0ead450.xml")
-        return httplib.ACCEPTED, body, headers, httplib.responses[httplib.ACCEPTED]
-
     def _api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6a(self, method, url, body, headers):
         status = httplib.OK
         if method == "GET":
@@ -1159,20 +1035,6 @@ class VCloud_1_5_MockHttp(MockHttp, unittest.TestCase):
             status = httplib.ACCEPTED
         return status, body, headers, httplib.responses[status]
 
-    def _api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6b(self, method, url, body, headers):
-        body = self.fixtures.load("api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6b.xml")
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
-
-    def _api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6c(self, method, url, body, headers):
-        body = self.fixtures.load("api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6c.xml")
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
-
-    def _api_vApp_vm_dd75d1d3_5b7b_48f0_aff3_69622ab7e045(self, method, url, body, headers):
-        body = self.fixtures.load(
-            "put_api_vApp_vm_dd75d1d3_5b7b_48f0_aff3_69622ab7e045_guestCustomizationSection.xml"
-        )
-        return httplib.ACCEPTED, body, headers, httplib.responses[httplib.ACCEPTED]
-
     def _api_vApp_vm_dd75d1d3_5b7b_48f0_aff3_69622ab7e045_guestCustomizationSection(
         self, method, url, body, headers
     ):
@@ -1188,81 +1050,19 @@ class VCloud_1_5_MockHttp(MockHttp, unittest.TestCase):
             status = httplib.ACCEPTED
         return status, body, headers, httplib.responses[status]
 
-    def _api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6a_power_action_reset(
-        self, method, url, body, headers
-    ):
-        return self._api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6b_power_action_all(
-            method, url, body, headers
-        )
-
-    def _api_task_b034df55_fe81_4798_bc81_1f0fd0ead450(self, method, url, body, headers):
-        body = self.fixtures.load("api_task_b034df55_fe81_4798_bc81_1f0fd0ead450.xml")
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
-
-    def _api_catalog_cddb3cb2_3394_4b14_b831_11fbc4028da4(self, method, url, body, headers):
-        body = self.fixtures.load("api_catalog_cddb3cb2_3394_4b14_b831_11fbc4028da4.xml")
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
-
-    def _api_catalogItem_3132e037_759b_4627_9056_ca66466fa607(self, method, url, body, headers):
-        body = self.fixtures.load("api_catalogItem_3132e037_759b_4627_9056_ca66466fa607.xml")
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
-
-    def _api_vApp_deployTest(self, method, url, body, headers):
-        body = self.fixtures.load("api_task_deploy.xml")
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
-
-    def _api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6a_action_deploy(
-        self, method, url, body, headers
-    ):
-        body = self.fixtures.load("api_task_deploy.xml")
-        return httplib.ACCEPTED, body, headers, httplib.responses[httplib.ACCEPTED]
-
-    def _api_task_deploy(self, method, url, body, headers):
-        body = self.fixtures.load("api_task_deploy.xml")
-        return httplib.ACCEPTED, body, headers, httplib.responses[httplib.ACCEPTED]
-
-    def _api_vApp_undeployTest(self, method, url, body, headers):
-        body = self.fixtures.load("api_vApp_undeployTest.xml")
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
-
-    def _api_vApp_undeployTest_action_undeploy(self, method, url, body, headers):
-        body = self.fixtures.load("api_task_undeploy.xml")
-        return httplib.ACCEPTED, body, headers, httplib.responses[httplib.ACCEPTED]
-
-    def _api_task_undeploy(self, method, url, body, headers):
-        body = self.fixtures.load("api_task_undeploy.xml")
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
-
-    def _api_vApp_undeployErrorTest(self, method, url, body, headers):
-        body = self.fixtures.load("api_vApp_undeployTest.xml")
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
-
     def _api_vApp_undeployErrorTest_action_undeploy(self, method, url, body, headers):
-        if b("shutdown") in b(body):
+        if b"shutdown" in b(body):
             body = self.fixtures.load("api_task_undeploy_error.xml")
         else:
             body = self.fixtures.load("api_task_undeploy.xml")
         return httplib.ACCEPTED, body, headers, httplib.responses[httplib.ACCEPTED]
 
-    def _api_task_undeployError(self, method, url, body, headers):
-        body = self.fixtures.load("api_task_undeploy_error.xml")
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
-
-    def _api_vApp_undeployPowerOffTest(self, method, url, body, headers):
-        return self._api_vApp_undeployTest(method, url, body, headers)
-
     def _api_vApp_undeployPowerOffTest_action_undeploy(self, method, url, body, headers):
-        self.assertIn(b("powerOff"), b(body))
+        assert b"powerOff" in b(body)
         return self._api_vApp_undeployTest_action_undeploy(method, url, body, headers)
 
     def _api_vApp_vapp_access_to_resource_forbidden(self, method, url, body, headers):
-        raise Exception(
-            ET.fromstring(self.fixtures.load("api_vApp_vapp_access_to_resource_forbidden.xml"))
-        )
-
-    def _api_vApp_vm_test(self, method, url, body, headers):
-        body = self.fixtures.load("api_vApp_vm_test.xml")
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
+        raise Exception(self._forbidden_error)
 
     def _api_vApp_vm_test_virtualHardwareSection_disks(self, method, url, body, headers):
         if method == "GET":
@@ -1291,13 +1091,6 @@ class VCloud_1_5_MockHttp(MockHttp, unittest.TestCase):
             status = httplib.ACCEPTED
         return status, body, headers, httplib.responses[status]
 
-    def _api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6b_power_action_powerOff(
-        self, method, url, body, headers
-    ):
-        return self._api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6b_power_action_all(
-            method, url, body, headers
-        )
-
     def _api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6b_power_action_all(
         self, method, url, body, headers
     ):
@@ -1307,16 +1100,28 @@ class VCloud_1_5_MockHttp(MockHttp, unittest.TestCase):
         )
         return httplib.ACCEPTED, body, headers, httplib.responses[httplib.ACCEPTED]
 
+    _api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6a_power_action_powerOn = (
+        _api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6b_power_action_all
+    )
+    _api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6a_power_action_reset = (
+        _api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6b_power_action_all
+    )
+    _api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6b_power_action_powerOff = (
+        _api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6b_power_action_all
+    )
+
     def _api_query(self, method, url, body, headers):
         assert method == "GET"
-        if "type=user" in url:
-            self.assertTrue("page=2" in url)
-            self.assertTrue("filter=(name==jrambo)" in url)
-            self.assertTrue("sortDesc=startDate")
+        qs = parse_qs(urlparse.urlsplit(url).query)
+        query_type = qs.get("type")
+        if query_type == ["user"]:
+            assert qs.get("page") == ["2"]
+            assert qs.get("filter") == ["(name==jrambo)"]
+            assert qs.get("sortDesc") == ["startDate"]
             body = self.fixtures.load("api_query_user.xml")
-        elif "type=group" in url:
+        elif query_type == ["group"]:
             body = self.fixtures.load("api_query_group.xml")
-        elif "type=vm" in url and "filter=(name==testVm2)" in url:
+        elif query_type == ["vm"] and qs.get("filter") == ["(name==testVm2)"]:
             body = self.fixtures.load("api_query_vm.xml")
         else:
             raise AssertionError("Unexpected query type")
@@ -1332,42 +1137,36 @@ class VCloud_1_5_MockHttp(MockHttp, unittest.TestCase):
             body = self.fixtures.load("api_vapp_get_metadata.xml")
             return httplib.OK, body, headers, httplib.responses[httplib.OK]
 
-    def _api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6b_controlAccess(
-        self, method, url, body, headers
-    ):
-        body = self.fixtures.load(
-            "api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6a_controlAccess.xml"
-        )
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
-
     def _api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6b_action_controlAccess(
         self, method, url, body, headers
     ):
-        body = str(body)
-        self.assertTrue(method == "POST")
-        self.assertTrue("<IsSharedToEveryone>false</IsSharedToEveryone>" in body)
-        self.assertTrue(
-            '<Subject href="https://vm-vcloud/api/admin/group/b8202c48-7151-4e61-9a6c-155474c7d413" />'
-            in body
-        )
-        self.assertTrue("<AccessLevel>FullControl</AccessLevel>" in body)
+        assert method == "POST"
+        assert self._control_access_body.search(b(body)), body
         body = self.fixtures.load(
             "api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6a_controlAccess.xml"
         )
         return httplib.OK, body, headers, httplib.responses[httplib.OK]
 
-    def _api_admin_group_b8202c48_7151_4e61_9a6c_155474c7d413(self, method, url, body, headers):
-        body = self.fixtures.load("api_admin_group_b8202c48_7151_4e61_9a6c_155474c7d413.xml")
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
-
-    def _api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6d(self, method, url, body, headers):
-        body = self.fixtures.load("api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6d.xml")
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
-
 
 class VCloud_5_5_MockHttp(VCloud_1_5_MockHttp):
     # TODO: Move 5.5 fixtures to their own folder
 
+    _fixture_routes = {
+        **VCloud_1_5_MockHttp._fixture_routes,
+        "_api_task_fab4b26f_4f2e_4d49_ad01_ae9324bbfe48": (
+            "api_task_b034df55_fe81_4798_bc81_1f0fd0ead450.xml",
+            httplib.OK,
+        ),
+        "_api_task_2518935e_b315_4d8e_9e99_9275f751877c": (
+            "api_task_2518935e_b315_4d8e_9e99_9275f751877c.xml",
+            httplib.OK,
+        ),
+        "_api_task_fe75d3af_f5a3_44a5_b016_ae0bdadfc32b": (
+            "api_task_fe75d3af_f5a3_44a5_b016_ae0bdadfc32b.xml",
+            httplib.OK,
+        ),
+    }
+
     def _api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6b_action_createSnapshot(
         self, method, url, body, headers
     ):
@@ -1377,10 +1176,6 @@ class VCloud_5_5_MockHttp(VCloud_1_5_MockHttp):
         )
         return httplib.OK, body, headers, httplib.responses[httplib.OK]
 
-    def _api_task_fab4b26f_4f2e_4d49_ad01_ae9324bbfe48(self, method, url, body, headers):
-        body = self.fixtures.load("api_task_b034df55_fe81_4798_bc81_1f0fd0ead450.xml")
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
-
     def _api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6b_action_removeAllSnapshots(
         self, method, url, body, headers
     ):
@@ -1390,10 +1185,6 @@ class VCloud_5_5_MockHttp(VCloud_1_5_MockHttp):
         )
         return httplib.OK, body, headers, httplib.responses[httplib.OK]
 
-    def _api_task_2518935e_b315_4d8e_9e99_9275f751877c(self, method, url, body, headers):
-        body = self.fixtures.load("api_task_2518935e_b315_4d8e_9e99_9275f751877c.xml")
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
-
     def _api_vApp_vapp_8c57a5b6_e61b_48ca_8a78_3b70ee65ef6b_action_revertToCurrentSnapshot(
         self, method, url, body, headers
     ):
@@ -1403,9 +1194,38 @@ class VCloud_5_5_MockHttp(VCloud_1_5_MockHttp):
         )
         return httplib.OK, body, headers, httplib.responses[httplib.OK]
 
-    def _api_task_fe75d3af_f5a3_44a5_b016_ae0bdadfc32b(self, method, url, body, headers):
-        body = self.fixtures.load("api_task_fe75d3af_f5a3_44a5_b016_ae0bdadfc32b.xml")
-        return httplib.OK, body, headers, httplib.responses[httplib.OK]
+
+# Drivers talking to the mock servers. The mock HTTP class is set on
+# connection subclasses rather than on the shared driver connection classes
+# so the tests using them don't depend on global state.
+class TerremarkMockConnection(TerremarkConnection):
+    conn_class = TerremarkMockHttp
+
+
+class TerremarkMockDriver(TerremarkDriver):
+    connectionCls = TerremarkMockConnection
+
+
+class VCloud_1_5_MockConnection(VCloud_1_5_Connection):
+    host = "test"
+    conn_class = VCloud_1_5_MockHttp
+
+
+class VCloud_1_5_MockDriver(VCloud_1_5_NodeDriver):
+    connectionCls = VCloud_1_5_MockConnection
+
+
+class VCloud_5_1_MockDriver(VCloud_5_1_NodeDriver):
+    connectionCls = VCloud_1_5_MockConnection
+
+
+class VCloud_5_5_MockConnection(VCloud_5_5_Connection):
+    host = "test"
+    conn_class = VCloud_5_5_MockHttp
+
+
+class VCloud_5_5_MockDriver(VCloud_5_5_NodeDriver):
+    connectionCls = VCloud_5_5_MockConnection
 
 
 if __name__ == "__main__":
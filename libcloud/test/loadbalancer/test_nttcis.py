@@ -14,18 +14,70 @@
 # limitations under the License.
 import os
 import sys
+import itertools
+from concurrent.futures import ThreadPoolExecutor, wait
 
 import pytest
 
 from libcloud.test import MockHttp, unittest
-from libcloud.utils.py3 import httplib
+from libcloud.utils.py3 import ET, httplib
 from libcloud.common.types import InvalidCredsError
+from libcloud.compute.base import Node
 from libcloud.test.secrets import NTTCIS_PARAMS
-from libcloud.common.nttcis import NttCisPool, NttCisVIPNode, NttCisPoolMember, NttCisAPIException
+from libcloud.common.nttcis import (
+    TYPES_URN,
+    NttCisPool,
+    NttCisVIPNode,
+    NttCisPoolMember,
+    NttCisAPIException,
+    process_xml,
+)
+from libcloud.compute.types import NodeState
 from libcloud.loadbalancer.base import Member, Algorithm, LoadBalancer
 from libcloud.loadbalancer.types import State
 from libcloud.test.file_fixtures import LoadBalancerFileFixtures
-from libcloud.loadbalancer.drivers.nttcis import NttCisLBDriver
+from libcloud.loadbalancer.drivers.nttcis import (
+    NttCisLBDriver,
+    _id_request,
+    _set_status_request,
+    _validate_pem_file,
+)
+
+
+class SerialExecutor:
+    """
+    Stand-in for ``ThreadPoolExecutor`` which spreads the calls round-robin
+    over ``max_workers`` threads, but runs them one at a time. MockHttp
+    patches requests for the whole process on every request, so it can't
+    serve several threads at once.
+    """
+
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+        self._workers = [ThreadPoolExecutor(max_workers=1) for _ in range(max_workers)]
+        self._next_worker = itertools.cycle(self._workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        for worker in self._workers:
+            worker.shutdown()
+
+    def submit(self, fn, *args, **kwargs):
+        future = next(self._next_worker).submit(fn, *args, **kwargs)
+        wait([future])
+        return future
+
+    def map(self, fn, *iterables):
+        return [self.submit(fn, *args).result() for args in zip(*iterables)]
+
+
+def recorded_request(action):
+    """
+    Parse the body of the last ``action`` request the mock recorded.
+    """
+    return ET.fromstring(NttCisMockHttp.request_bodies[action][-1])
 
 
 @pytest.fixture()
@@ -33,10 +85,27 @@ def driver():
     NttCisLBDriver.connectionCls.active_api_version = "2.7"
     NttCisLBDriver.connectionCls.conn_class = NttCisMockHttp
     NttCisMockHttp.type = None
+    NttCisMockHttp.request_bodies = {}
     driver = NttCisLBDriver(*NTTCIS_PARAMS)
     return driver
 
 
+@pytest.fixture()
+def executors(monkeypatch):
+    """
+    Replace the driver's thread pools with :class:`SerialExecutor`, the
+    executors it creates are returned.
+    """
+    created = []
+
+    def executor(max_workers):
+        created.append(SerialExecutor(max_workers))
+        return created[-1]
+
+    monkeypatch.setattr("libcloud.loadbalancer.drivers.nttcis.ThreadPoolExecutor", executor)
+    return created
+
+
 def test_invalid_region(driver):
     with pytest.raises(ValueError):
         NttCisLBDriver(*NTTCIS_PARAMS, region="blah")
@@ -72,6 +141,64 @@ def test_create_balancer(driver, capsys):
     assert balancer.extra["listener_ip_address"] == "5.6.7.8"
 
 
+def test_create_balancer_parallel(driver, executors):
+    driver.ex_set_current_network_domain("1234")
+    # Not Member instances, so a node is created for each of them first
+    members = [
+        Node(None, "node1", NodeState.RUNNING, [], ["1.2.3.4"], driver),
+        Node(None, "node2", NodeState.RUNNING, [], ["1.2.3.5"], driver),
+    ]
+
+    balancer = driver.create_balancer(
+        name="test",
+        port=80,
+        protocol="http",
+        algorithm=Algorithm.ROUND_ROBIN,
+        members=members,
+        ex_parallel=True,
+    )
+    assert balancer.id == "8334f461-0df0-42d5-97eb-f4678eb26bea"
+    assert balancer.extra["pool_id"] == "9e6b496d-5261-4542-91aa-b50c7f569c54"
+    assert executors[0].max_workers == 2
+    ips = [
+        ET.fromstring(body).findtext("{%s}ipv4Address" % TYPES_URN)
+        for body in NttCisMockHttp.request_bodies["createNode"]
+    ]
+    assert sorted(ips) == ["1.2.3.4", "1.2.3.5"]
+    assert len(NttCisMockHttp.request_bodies["addPoolMember"]) == 2
+
+
+def test_create_balancer_parallel_reuses_worker_connections(driver, executors, monkeypatch):
+    driver.ex_set_current_network_domain("1234")
+    copies = []
+    copy_with_new_connection = driver._copy_with_new_connection
+
+    def record_copy():
+        copies.append(copy_with_new_connection())
+        return copies[-1]
+
+    monkeypatch.setattr(driver, "_copy_with_new_connection", record_copy)
+    closed = []
+    monkeypatch.setattr("requests.Session.close", lambda session: closed.append(session))
+    members = [Member(id=None, ip="1.2.3.%s" % (i), port=80) for i in range(20)]
+
+    driver.create_balancer(
+        name="test",
+        port=80,
+        protocol="http",
+        algorithm=Algorithm.ROUND_ROBIN,
+        members=members,
+        ex_parallel=True,
+    )
+    # The pool is capped at 8 workers, each keeps one copy for all its members
+    assert executors[0].max_workers == 8
+    assert len(copies) == 8
+    assert len(NttCisMockHttp.request_bodies["addPoolMember"]) == 20
+    # The copies share the orgId and have their sessions closed afterwards
+    assert len(NttCisMockHttp.request_bodies["myaccount"]) == 1
+    assert closed == [copy.connection.connection.session for copy in copies]
+
+
 def test_create_balancer_with_defaults(driver):
     driver.ex_set_current_network_domain("1234")
 
@@ -273,6 +400,43 @@ def test_ex_create_node(driver):
     assert node.id == "9e6b496d-5261-4542-91aa-b50c7f569c54"
 
 
+def test_ex_create_node_escapes_values(driver):
+    node = driver.ex_create_node(
+        network_domain_id="12345",
+        name="test & <node>",
+        ip="123.12.32.2",
+        ex_description='"quoted" description',
+    )
+    assert node.id == "9e6b496d-5261-4542-91aa-b50c7f569c54"
+    request = recorded_request("createNode")
+    assert request.findtext("{%s}name" % TYPES_URN) == "test & <node>"
+    assert request.findtext("{%s}description" % TYPES_URN) == '"quoted" description'
+
+
+def test_ex_create_pool_escapes_values(driver):
+    driver.ex_create_pool(
+        network_domain_id="1234",
+        name="test&<pool>",
+        balancer_method="ROUND_ROBIN",
+        ex_description='"quoted" description',
+    )
+    request = recorded_request("createPool")
+    assert request.findtext("{%s}name" % TYPES_URN) == "test&<pool>"
+    assert request.findtext("{%s}description" % TYPES_URN) == '"quoted" description'
+
+
+def test_ex_create_virtual_listener_escapes_values(driver):
+    driver.ex_create_virtual_listener(
+        network_domain_id="12345",
+        name="test & <listener>",
+        ex_description='"quoted" description',
+        port=80,
+    )
+    request = recorded_request("createVirtualListener")
+    assert request.findtext("{%s}name" % TYPES_URN) == "test & <listener>"
+    assert request.findtext("{%s}description" % TYPES_URN) == '"quoted" description'
+
+
 def test_ex_create_pool(
     driver,
 ):
@@ -289,6 +453,43 @@ def test_ex_create_pool(
     assert pool.status == State.RUNNING
 
 
+def test_ex_create_pool_explicit_none(driver):
+    driver.ex_create_pool(
+        network_domain_id="1234",
+        name="test",
+        balancer_method=None,
+        ex_description="test",
+        slow_ramp_time=None,
+    )
+    request = recorded_request("createPool")
+    assert request.findtext("{%s}loadBalanceMethod" % TYPES_URN) == "None"
+    assert request.findtext("{%s}slowRampTime" % TYPES_URN) == "None"
+
+
+def test_id_request_matches_element_tree():
+    for id in ("4d360b1f-bc2c-4ab7-9884-1f03ba2768f7", 'a&b<"c>', "pööl-ü"):
+        element = ET.Element("deletePool", {"xmlns": TYPES_URN}, id=id)
+        body = _id_request("deletePool", id)
+        assert isinstance(body, bytes)
+        assert body == ET.tostring(element, encoding="utf-8")
+
+        element = ET.Element("editNode", {"xmlns": TYPES_URN}, id=id)
+        ET.SubElement(element, "status").text = "DISABLED"
+        body = _set_status_request("editNode", id, False)
+        assert isinstance(body, bytes)
+        assert body == ET.tostring(element, encoding="utf-8")
+
+
+def test_ex_create_pool_name_with_spaces(driver):
+    pool = driver.ex_create_pool(
+        network_domain_id="1234",
+        name="test pool",
+        balancer_method="ROUND_ROBIN",
+        ex_description="test",
+    )
+    assert pool.name == "test_pool"
+
+
 def test_ex_create_virtual_listener(driver):
     listener = driver.ex_create_virtual_listener(
         network_domain_id="12345",
@@ -368,6 +569,23 @@ def test_get_balancer(driver):
     assert bal.state == State.RUNNING
 
 
+def test_list_balancers_cached(driver):
+    driver = NttCisLBDriver(*NTTCIS_PARAMS, ex_cache_ttl=60)
+    bal = driver.list_balancers()
+    NttCisMockHttp.type = "UNAUTHORIZED"
+    assert driver.list_balancers()[0].id == bal[0].id
+    driver.ex_clear_cache()
+    with pytest.raises(InvalidCredsError):
+        driver.list_balancers()
+
+
+def test_list_balancers_not_cached_by_default(driver):
+    driver.list_balancers()
+    NttCisMockHttp.type = "UNAUTHORIZED"
+    with pytest.raises(InvalidCredsError):
+        driver.list_balancers()
+
+
 def test_list_protocols(driver):
     protocols = driver.list_protocols()
     assert 0 < len(protocols)
@@ -419,6 +637,64 @@ def test_ex_get_pool(driver):
     assert pool.id == "4d360b1f-bc2c-4ab7-9884-1f03ba2768f7"
 
 
+def test_ex_wait_for_state(driver):
+    pool = driver.ex_wait_for_state(
+        "NORMAL", driver.ex_get_pool, pool_id="4d360b1f-bc2c-4ab7-9884-1f03ba2768f7"
+    )
+    assert pool.id == "4d360b1f-bc2c-4ab7-9884-1f03ba2768f7"
+
+
+def test_ex_wait_for_state_backoff(driver, monkeypatch):
+    delays = []
+    monkeypatch.setattr("time.sleep", delays.append)
+    statuses = iter(["PENDING_ADD"] * 5 + ["NORMAL"])
+    pool = driver.ex_get_pool("4d360b1f-bc2c-4ab7-9884-1f03ba2768f7")
+
+    def get_pool():
+        pool.status = next(statuses)
+        return pool
+
+    driver.ex_wait_for_state("NORMAL", get_pool, poll_interval=2, timeout=60)
+    assert delays == [0.25, 0.5, 1, 2, 2]
+
+
+def test_ex_wait_for_state_list(driver):
+    pool = driver.ex_wait_for_state(
+        ["PENDING_ADD", "NORMAL"],
+        driver.ex_get_pool,
+        pool_id="4d360b1f-bc2c-4ab7-9884-1f03ba2768f7",
+    )
+    assert pool.id == "4d360b1f-bc2c-4ab7-9884-1f03ba2768f7"
+
+
+def test_ex_wait_for_state_node(driver):
+    node = Node("1234", "node1", NodeState.RUNNING, [], ["1.2.3.4"], driver)
+    assert driver.ex_wait_for_state("running", lambda: node) is node
+
+
+def test_ex_wait_for_state_invalid_poll_interval(driver):
+    with pytest.raises(ValueError):
+        driver.ex_wait_for_state(
+            "NORMAL",
+            driver.ex_get_pool,
+            poll_interval=0,
+            pool_id="4d360b1f-bc2c-4ab7-9884-1f03ba2768f7",
+        )
+
+
+def test_ex_wait_for_state_FAIL(driver):
+    with pytest.raises(NttCisAPIException) as context:
+        driver.ex_wait_for_state(
+            "PENDING_ADD",
+            driver.ex_get_pool,
+            pool_id="4d360b1f-bc2c-4ab7-9884-1f03ba2768f7",
+            poll_interval=0.1,
+            timeout=0.1,
+        )
+    assert context.value.code == "normal"
+    assert "timed out" in context.value.msg
+
+
 def test_ex_update_pool(driver):
     pool = driver.ex_get_pool("4d360b1f-bc2c-4ab7-9884-1f03ba2768f7")
     pool.slow_ramp_time = "120"
@@ -526,6 +802,18 @@ def test_ex_get_default_irules(driver):
     assert irules[0].compatible_listeners[0].type == "PERFORMANCE_LAYER_4"
 
 
+def test_ex_get_default_catalogs_cached(driver):
+    driver = NttCisLBDriver(*NTTCIS_PARAMS, ex_cache_ttl=60)
+    network_domain_id = "4d360b1f-bc2c-4ab7-9884-1f03ba2768f7"
+    monitors = driver.ex_get_default_health_monitors(network_domain_id)
+    profiles = driver.ex_get_default_persistence_profiles(network_domain_id)
+    irules = driver.ex_get_default_irules(network_domain_id)
+    NttCisMockHttp.type = "UNAUTHORIZED"
+    assert driver.ex_get_default_health_monitors(network_domain_id)[0].id == monitors[0].id
+    assert driver.ex_get_default_persistence_profiles(network_domain_id)[0].id == profiles[0].id
+    assert driver.ex_get_default_irules(network_domain_id)[0].id == irules[0].id
+
+
 def test_ex_insert_ssl_certificate(driver):
     net_dom_id = "6aafcf08-cb0b-432c-9c64-7371265db086 "
     cert = (
@@ -542,6 +830,89 @@ def test_ex_insert_ssl_certificate(driver):
     assert result is True
 
 
+def test_ex_insert_ssl_certificate_validate(driver):
+    pytest.importorskip("OpenSSL")
+    net_dom_id = "6aafcf08-cb0b-432c-9c64-7371265db086 "
+    fixtures_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "nttcis")
+    result = driver.ex_import_ssl_domain_certificate(
+        net_dom_id,
+        "alice",
+        os.path.join(fixtures_dir, "alice.crt"),
+        os.path.join(fixtures_dir, "alice.key"),
+        description="test cert",
+        validate=True,
+    )
+    assert result is True
+
+
+def test_ex_insert_ssl_certificate_validate_invalid(driver):
+    crypto = pytest.importorskip("OpenSSL.crypto")
+    net_dom_id = "6aafcf08-cb0b-432c-9c64-7371265db086 "
+    fixtures_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "nttcis")
+    with pytest.raises(crypto.Error):
+        driver.ex_import_ssl_domain_certificate(
+            net_dom_id,
+            "alice",
+            os.path.join(fixtures_dir, "alice.key"),
+            os.path.join(fixtures_dir, "alice.key"),
+            validate=True,
+        )
+
+
+def test_ex_import_ssl_cert_chain(driver):
+    net_dom_id = "6aafcf08-cb0b-432c-9c64-7371265db086 "
+    fixtures_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "nttcis")
+    result = driver.ex_import_ssl_cert_chain(
+        net_dom_id,
+        "ted_carol",
+        os.path.join(fixtures_dir, "chain.crt"),
+        description="test cert chain",
+    )
+    assert result is True
+
+
+def test_ex_import_ssl_cert_chain_validate(driver):
+    pytest.importorskip("OpenSSL")
+    net_dom_id = "6aafcf08-cb0b-432c-9c64-7371265db086 "
+    fixtures_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "nttcis")
+    result = driver.ex_import_ssl_cert_chain(
+        net_dom_id, "ted_carol", os.path.join(fixtures_dir, "chain.crt"), validate=True
+    )
+    assert result is True
+
+
+def test_ex_import_ssl_cert_chain_validate_memoized(driver):
+    pytest.importorskip("OpenSSL")
+    net_dom_id = "6aafcf08-cb0b-432c-9c64-7371265db086 "
+    fixtures_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "nttcis")
+    chain_file = os.path.join(fixtures_dir, "chain.crt")
+    driver.ex_import_ssl_cert_chain(net_dom_id, "ted_carol", chain_file, validate=True)
+    hits = _validate_pem_file.cache_info().hits
+    result = driver.ex_import_ssl_cert_chain(net_dom_id, "ted_carol", chain_file, validate=True)
+    assert result is True
+    assert _validate_pem_file.cache_info().hits == hits + 1
+
+
+def test_ex_insert_ssl_certificate_validate_memoized(driver):
+    crypto = pytest.importorskip("OpenSSL.crypto")
+    net_dom_id = "6aafcf08-cb0b-432c-9c64-7371265db086 "
+    fixtures_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "nttcis")
+    crt_file = os.path.join(fixtures_dir, "alice.crt")
+    key_file = os.path.join(fixtures_dir, "alice.key")
+    _validate_pem_file.cache_clear()
+    for _ in range(2):
+        driver.ex_import_ssl_domain_certificate(
+            net_dom_id, "alice", crt_file, key_file, validate=True
+        )
+    info = _validate_pem_file.cache_info()
+    assert (info.hits, info.misses) == (2, 2)
+    # Only the outcome is cached, never the (private key) contents
+    stat = os.stat(key_file)
+    assert (
+        _validate_pem_file(key_file, stat.st_mtime_ns, stat.st_size, crypto.load_privatekey) is None
+    )
+
+
 def test_ex_insert_ssl_certificate_FAIL(driver):
     NttCisMockHttp.type = "FAIL"
     net_dom_id = "6aafcf08-cb0b-432c-9c64-7371265db086 "
@@ -562,6 +933,42 @@ def test_ex_insert_ssl_certificate_FAIL(driver):
     )
 
 
+SSL_DOMAIN_CERT_XML = (
+    b'<sslDomainCertificate xmlns="urn:didata.com:api:cloud:types" id="abc">'
+    b"<name>alice</name><state>NORMAL</state></sslDomainCertificate>"
+)
+
+
+def test_process_xml_serialized_or_parsed():
+    for xml in (
+        SSL_DOMAIN_CERT_XML,
+        SSL_DOMAIN_CERT_XML.decode(),
+        ET.fromstring(SSL_DOMAIN_CERT_XML),
+    ):
+        cert = process_xml(xml)
+        assert (cert.id, cert.name, cert.state) == ("abc", "alice", "NORMAL")
+
+
+def test_process_xml_lxml_element():
+    etree = pytest.importorskip("lxml.etree")
+    cert = process_xml(etree.fromstring(SSL_DOMAIN_CERT_XML))
+    assert (cert.id, cert.name, cert.state) == ("abc", "alice", "NORMAL")
+
+
+def test_ex_snapshot(driver, executors, monkeypatch):
+    closed = []
+    monkeypatch.setattr("requests.Session.close", lambda session: closed.append(session))
+    snapshot = driver.ex_snapshot()
+    assert executors[0].max_workers == 5
+    assert len(NttCisMockHttp.request_bodies["myaccount"]) == 1
+    assert len(closed) == 5
+    assert snapshot.pools[0].id == driver.ex_get_pools()[0].id
+    assert snapshot.nodes[0].id == driver.ex_get_nodes()[0].id
+    assert snapshot.ssl_domain_certs[0].name == "alice"
+    assert snapshot.ssl_certificate_chains[0].name == "ted_carol"
+    assert snapshot.ssl_offload_profiles[0].name == "ssl_offload"
+
+
 def test_ex_create_ssl_offload_profile(driver):
     net_domain_id = "6aafcf08-cb0b-432c-9c64-7371265db086"
     name = "ssl_offload"
@@ -627,13 +1034,21 @@ def test_delete_ssl_domain_certificate(driver):
     assert result is True
 
 
+class InvalidRequestError(Exception):
+    def __init__(self, tag):
+        super().__init__("Invalid Request - %s" % tag)
+
+
 class NttCisMockHttp(MockHttp):
     fixtures = LoadBalancerFileFixtures("nttcis")
+    # Bodies of the requests tests check, by action name
+    request_bodies = {}
 
     def _oec_0_9_myaccount_UNAUTHORIZED(self, method, url, body, headers):
         return (httplib.UNAUTHORIZED, "", {}, httplib.responses[httplib.UNAUTHORIZED])
 
     def _oec_0_9_myaccount(self, method, url, body, headers):
+        self.request_bodies.setdefault("myaccount", []).append(body)
         body = self.fixtures.load("oec_0_9_myaccount.xml")
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
@@ -651,6 +1066,11 @@ class NttCisMockHttp(MockHttp):
         body = self.fixtures.load("networkDomainVip_virtualListener.xml")
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
+    def _caas_2_7_8a8f6abc_2745_4d8a_9cbc_8dabe5a7d0e4_networkDomainVip_virtualListener_UNAUTHORIZED(
+        self, method, url, body, headers
+    ):
+        return (httplib.UNAUTHORIZED, "", {}, httplib.responses[httplib.UNAUTHORIZED])
+
     def _caas_2_7_8a8f6abc_2745_4d8a_9cbc_8dabe5a7d0e4_networkDomainVip_virtualListener_6115469d_a8bb_445b_bb23_d23b5283f2b9(
         self, method, url, body, headers
     ):
@@ -688,24 +1108,37 @@ class NttCisMockHttp(MockHttp):
     def _caas_2_7_8a8f6abc_2745_4d8a_9cbc_8dabe5a7d0e4_networkDomainVip_createPool(
         self, method, url, body, headers
     ):
+        request = ET.fromstring(body)
+        if request.tag != "{%s}createPool" % (TYPES_URN):
+            raise InvalidRequestError(request.tag)
+        self.request_bodies.setdefault("createPool", []).append(body)
         body = self.fixtures.load("networkDomainVip_createPool.xml")
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
     def _caas_2_7_8a8f6abc_2745_4d8a_9cbc_8dabe5a7d0e4_networkDomainVip_createNode(
         self, method, url, body, headers
     ):
+        request = ET.fromstring(body)
+        if request.tag != "{%s}createNode" % (TYPES_URN):
+            raise InvalidRequestError(request.tag)
+        self.request_bodies.setdefault("createNode", []).append(body)
         body = self.fixtures.load("networkDomainVip_createNode.xml")
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
     def _caas_2_7_8a8f6abc_2745_4d8a_9cbc_8dabe5a7d0e4_networkDomainVip_addPoolMember(
         self, method, url, body, headers
     ):
+        self.request_bodies.setdefault("addPoolMember", []).append(body)
         body = self.fixtures.load("networkDomainVip_addPoolMember.xml")
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
     def _caas_2_7_8a8f6abc_2745_4d8a_9cbc_8dabe5a7d0e4_networkDomainVip_createVirtualListener(
         self, method, url, body, headers
     ):
+        request = ET.fromstring(body)
+        if request.tag != "{%s}createVirtualListener" % (TYPES_URN):
+            raise InvalidRequestError(request.tag)
+        self.request_bodies.setdefault("createVirtualListener", []).append(body)
         body = self.fixtures.load("networkDomainVip_createVirtualListener.xml")
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
@@ -748,6 +1181,9 @@ class NttCisMockHttp(MockHttp):
     def _caas_2_7_8a8f6abc_2745_4d8a_9cbc_8dabe5a7d0e4_networkDomainVip_editNode(
         self, method, url, body, headers
     ):
+        request = ET.fromstring(body)
+        if request.get("id") is None:
+            raise InvalidRequestError(request.tag)
         body = self.fixtures.load("networkDomainVip_editNode.xml")
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
@@ -793,6 +1229,12 @@ class NttCisMockHttp(MockHttp):
         body = self.fixtures.load("ssl_import_fail.xml")
         return (httplib.BAD_REQUEST, body, {}, httplib.responses[httplib.OK])
 
+    def _caas_2_7_8a8f6abc_2745_4d8a_9cbc_8dabe5a7d0e4_networkDomainVip_importSslCertificateChain(
+        self, method, url, body, headers
+    ):
+        body = self.fixtures.load("ssl_import_cert_chain.xml")
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
     def _caas_2_7_8a8f6abc_2745_4d8a_9cbc_8dabe5a7d0e4_networkDomainVip_sslDomainCertificate_LIST(
         self, method, url, body, headers
     ):
@@ -811,6 +1253,18 @@ class NttCisMockHttp(MockHttp):
         body = self.fixtures.load("ssl_cert_by_name.xml")
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
 
+    def _caas_2_7_8a8f6abc_2745_4d8a_9cbc_8dabe5a7d0e4_networkDomainVip_sslCertificateChain(
+        self, method, url, body, headers
+    ):
+        body = self.fixtures.load("ssl_list_cert_chain_by_name.xml")
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
+    def _caas_2_7_8a8f6abc_2745_4d8a_9cbc_8dabe5a7d0e4_networkDomainVip_sslOffloadProfile(
+        self, method, url, body, headers
+    ):
+        body = self.fixtures.load("list_ssl_offload_profiles.xml")
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
     def _caas_2_7_8a8f6abc_2745_4d8a_9cbc_8dabe5a7d0e4_networkDomainVip_createSslOffloadProfile(
         self, method, url, body, headers
     ):
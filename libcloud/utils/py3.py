@@ -24,6 +24,9 @@
 import sys
 import types
 
+# lxml is intentionally not preferred by default. Many drivers build request
+# bodies with ET.Element(tag, {"xmlns": ...}) and rely on stdlib ElementTree
+# serialization details, both of which lxml rejects or handles differently.
 DEFAULT_LXML = False
 
 try: